@@ -0,0 +1,144 @@
+"""Scaling benchmark of SeidelMethod.
+
+    python benchmarks/bench_seidel.py --max-size 100000 --output results.json
+
+Times the object and vectorized SeidelMethod and ClarksonMethod for every
+kind of generated program and size, checks results of small programs against
+enumeration of vertices and writes all measurements as JSON, to compare runs
+across versions.
+"""
+import json
+import platform
+import statistics
+import time
+from importlib import metadata
+from typing import List, Optional
+
+import numpy as np
+import typer
+
+import seidel
+from seidel.linear_program import Constraint, ProgramStatus, Target
+
+from programs import GENERATORS
+from reference import solve_by_vertices
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+def solve_objects(target: np.ndarray, constraints: np.ndarray, rng):
+    program = seidel.LinearProgram(
+        Target.from_coefficients(*target),
+        [Constraint.from_coefficients(*row) for row in constraints.tolist()],
+    )
+    started = time.perf_counter()
+    seidel.Solver(seidel.SeidelMethod(seed=rng)).solve(program)
+    return program, time.perf_counter() - started
+
+
+def solve_vectorized(target: np.ndarray, constraints: np.ndarray, rng):
+    program = seidel.LinearProgram(Target.from_coefficients(*target), [])
+    arrays = seidel.ConstraintArray.from_coefficients(constraints)
+    started = time.perf_counter()
+    seidel.SeidelMethod(vectorized=True).solve_arrays(
+        program, arrays, rng.permutation(len(arrays))
+    )
+    return program, time.perf_counter() - started
+
+
+def solve_clarkson(target: np.ndarray, constraints: np.ndarray, rng):
+    global clarkson
+    if clarkson is None:
+        # the process pool is started once for all runs
+        clarkson = seidel.ClarksonMethod(seed=int(rng.integers(2**32)))
+    program = seidel.LinearProgram(Target.from_coefficients(*target), [])
+    arrays = seidel.ConstraintArray.from_coefficients(constraints)
+    started = time.perf_counter()
+    clarkson.solve_arrays(program, arrays)
+    return program, time.perf_counter() - started
+
+
+clarkson = None
+METHODS = {
+    "object": solve_objects,
+    "vectorized": solve_vectorized,
+    "clarkson": solve_clarkson,
+}
+
+
+def agrees(program: seidel.LinearProgram, expected) -> bool:
+    status, value = expected
+    if program.status.name != status:
+        return False
+    if program.status != ProgramStatus.OPTIMAL:
+        return True
+    return abs(program.target(program.solution) - value) <= 1e-6 * (1 + abs(value))
+
+
+def main(
+    max_size: int = 1_000_000,
+    repeat: int = 3,
+    check_size: int = 100,
+    kind: Optional[List[str]] = typer.Option(None, help="Kinds of programs."),
+    method: Optional[List[str]] = typer.Option(None, help="Methods to time."),
+    seed: int = 0,
+    output: str = "bench_results.json",
+):
+    rng = np.random.default_rng(seed)
+    results = []
+    for kind_name in kind or list(GENERATORS):
+        for size in [size for size in SIZES if size <= max_size]:
+            for method_name in method or list(METHODS):
+                seconds = []
+                statuses = set()
+                checked = mismatches = 0
+                for _ in range(repeat):
+                    target, constraints = GENERATORS[kind_name](size, rng)
+                    program, elapsed = METHODS[method_name](target, constraints, rng)
+                    seconds.append(elapsed)
+                    statuses.add(program.status.name)
+                    if size <= check_size:
+                        checked += 1
+                        expected = solve_by_vertices(target, constraints)
+                        mismatches += not agrees(program, expected)
+                result = {
+                    "kind": kind_name,
+                    "size": size,
+                    "method": method_name,
+                    "seconds": seconds,
+                    "median": statistics.median(seconds),
+                    "statuses": sorted(statuses),
+                    "checked": checked,
+                    "mismatches": mismatches,
+                }
+                results.append(result)
+                typer.echo(
+                    f"{kind_name:12} {size:>8} {method_name:10} "
+                    f"{result['median'] * 1000:10.3f} ms  {','.join(result['statuses'])}"
+                    + (f"  {mismatches} MISMATCHES" if mismatches else "")
+                )
+
+    if clarkson is not None:
+        clarkson.close()
+
+    try:
+        version = metadata.version("seidel")
+    except metadata.PackageNotFoundError:
+        version = None
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "seidel": version,
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "time": time.time(),
+                "seed": seed,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
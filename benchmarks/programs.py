@@ -0,0 +1,73 @@
+"""Generators of random programs for benchmarks.
+
+Every generator returns coefficients of the target (2,) and of the
+constraints (n, 3), rows are A, B, C of the Ax + By <= C inequalities.
+Programs are solved in the I quart, axes are not among the constraints."""
+from typing import Tuple
+
+import numpy as np
+
+Program = Tuple[np.ndarray, np.ndarray]
+
+
+def random_target(rng: np.random.Generator) -> np.ndarray:
+    return rng.uniform(0.1, 3.0, 2)
+
+
+def tangents(angles: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    return np.stack([np.cos(angles), np.sin(angles), offsets], axis=1)
+
+
+def feasible(n: int, rng: np.random.Generator) -> Program:
+    """Bounded program, (0, 0) satisfies every constraint."""
+    angles = rng.uniform(0, 2 * np.pi, n)
+    # one constraint that closes the I quart, so that the optimum exists
+    angles[0] = np.pi / 4
+    return random_target(rng), tangents(angles, rng.uniform(1.0, 2.0, n))
+
+
+def infeasible(n: int, rng: np.random.Generator) -> Program:
+    """Feasible program with one pair of parallel constraints that dont overlap."""
+    target, constraints = feasible(n, rng)
+    i, j = rng.choice(n, 2, replace=False)
+    angle = rng.uniform(0, 2 * np.pi)
+    constraints[i] = tangents(np.array([angle]), np.array([1.0]))
+    constraints[j] = tangents(np.array([angle + np.pi]), np.array([-3.0]))
+    return target, constraints
+
+
+def unbounded(n: int, rng: np.random.Generator) -> Program:
+    """No constraint blocks the (1, 1) direction, improving for positive target."""
+    angles = rng.uniform(3 * np.pi / 4, 7 * np.pi / 4, n)
+    return random_target(rng), tangents(angles, rng.uniform(1.0, 2.0, n))
+
+
+def degenerate(n: int, rng: np.random.Generator) -> Program:
+    """Many parallel, axis aligned and duplicated constraints."""
+    directions = np.array([(1, 0), (0, 1), (1, 1), (-1, 2), (2, -1), (-1, 0)])
+    rows = directions[rng.integers(0, len(directions), n)]
+    offsets = rng.integers(1, 5, n).astype(np.float64)
+    constraints = np.column_stack([rows, offsets]).astype(np.float64)
+    constraints[0] = (1, 1, 4)
+    return random_target(rng), constraints
+
+
+def adversarial(n: int, rng: np.random.Generator) -> Program:
+    """Tangents of the unit circle ordered so that each one violates the
+    optimum of the previous ones, unless the solver shuffles them."""
+    target = random_target(rng)
+    optimum = np.arctan2(target[1], target[0])
+    distance = rng.uniform(0, np.pi / 2, n)
+    distance.sort()
+    sides = rng.choice([-1.0, 1.0], n)
+    angles = optimum + sides * distance[::-1]
+    return target, tangents(angles, np.ones(n))
+
+
+GENERATORS = {
+    "feasible": feasible,
+    "infeasible": infeasible,
+    "unbounded": unbounded,
+    "degenerate": degenerate,
+    "adversarial": adversarial,
+}
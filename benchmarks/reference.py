@@ -0,0 +1,40 @@
+"""Independent solution of small programs by enumeration of vertices."""
+from typing import Tuple, Union
+
+import numpy as np
+
+AXES = np.array([(-1.0, 0.0, 0.0), (0.0, -1.0, 0.0)])
+TOLERANCE = 1e-7
+
+
+def solve_by_vertices(
+    target: np.ndarray, constraints: np.ndarray
+) -> Tuple[str, Union[float, None]]:
+    """Returns name of the program status and optimal value of the target.
+
+    Checks every intersection of two constraint lines (O(n^3)), so it is meant
+    only for programs of tens of constraints."""
+    constraints = np.vstack([constraints, AXES])
+    a, b, c = constraints.T
+    first, second = np.triu_indices(len(constraints), 1)
+    determinant = a[first] * b[second] - a[second] * b[first]
+    pairs = np.abs(determinant) > 1e-12
+    first, second, determinant = first[pairs], second[pairs], determinant[pairs]
+    x = (c[first] * b[second] - c[second] * b[first]) / determinant
+    y = (a[first] * c[second] - a[second] * c[first]) / determinant
+
+    scale = 1 + np.abs(c)
+    feasible = (np.outer(x, a) + np.outer(y, b) <= c + TOLERANCE * scale).all(axis=1)
+    if not feasible.any():
+        return "INFEASIBLE", None
+
+    # the program is unbounded when the target grows along an extreme ray
+    # of the feasible space, rays are axes or lie on constraint lines
+    rays = np.vstack([np.eye(2), np.column_stack([-b, a]), np.column_stack([b, -a])])
+    rays = rays[(rays >= -1e-12).all(axis=1) & (np.abs(rays).sum(axis=1) > 0)]
+    recession = (np.outer(rays[:, 0], a) + np.outer(rays[:, 1], b) <= 1e-9).all(axis=1)
+    if (rays[recession] @ target > 1e-9).any():
+        return "UNBOUNDED", None
+
+    values = target[0] * x[feasible] + target[1] * y[feasible]
+    return "OPTIMAL", float(values.max())
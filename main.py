@@ -1,9 +1,19 @@
+import asyncio
+import json
+import sys
+import time
+from typing import List, Optional
+
 import typer
 
 import seidel
 
+app = typer.Typer()
+
 
-def main(id: int, program_file_path: str = "programs.txt") -> seidel.SeidelMethod:
+@app.command()
+def solve(id: int, program_file_path: str = "programs.txt") -> seidel.LinearProgram:
+    """Solve a single program and print the solution."""
     program = seidel.read_program(id, program_file_path)
     solver = seidel.Solver(seidel.SeidelMethod())
     solver.solve(program)
@@ -11,5 +21,94 @@ def main(id: int, program_file_path: str = "programs.txt") -> seidel.SeidelMetho
     return program
 
 
+@app.command()
+def stream(
+    program_file_path: str = "programs.txt",
+    id: Optional[List[int]] = typer.Option(None, help="Solve only these ids."),
+    start: Optional[int] = typer.Option(None, help="First id to solve."),
+    stop: Optional[int] = typer.Option(None, help="Ids from this one are skipped."),
+    vectorized: bool = False,
+    cache_file: Optional[str] = typer.Option(
+        None, help="Reuse results of programs solved before, kept in this file."
+    ),
+    move_to_front: bool = typer.Option(
+        False, help="Apply constraints that defined previous optima first."
+    ),
+    seed: Optional[int] = typer.Option(
+        None, help="Seed of the orders of constraints, for reproducible runs."
+    ),
+):
+    """Solve programs of the file one by one, printing JSON line for each."""
+    ids = set(id) if id else None
+    if start is not None or stop is not None:
+        ids = range(start or 0, stop if stop is not None else sys.maxsize)
+        if id:
+            ids = set(id).intersection(ids)
+
+    cache = seidel.ResultCache(path=cache_file) if cache_file else None
+    ordering = seidel.MoveToFront() if move_to_front else None
+    method = seidel.SeidelMethod(vectorized=vectorized, ordering=ordering, seed=seed)
+    solver = seidel.Solver(method, cache=cache)
+    for program_id, program in seidel.iter_programs(program_file_path, ids):
+        started = time.perf_counter()
+        solver.solve(program)
+        result = {"id": program_id, **program.to_dict()}
+        result["seconds"] = time.perf_counter() - started
+        typer.echo(json.dumps(result))
+    if cache is not None:
+        cache.save()
+
+
+@app.command()
+def convert(program_file_path: str, binary_file_path: str):
+    """Convert programs file to the binary format."""
+    count = seidel.convert_programs(program_file_path, binary_file_path)
+    typer.echo(f"Converted {count} programs to {binary_file_path}")
+
+
+@app.command()
+def batch(
+    binary_file_path: str,
+    processes: Optional[int] = typer.Option(None, help="Number of processes."),
+    chunk_size: int = typer.Option(256, help="Programs solved by a single task."),
+    seed: Optional[int] = None,
+    vectorized: bool = False,
+):
+    """Solve all programs of a binary file in a process pool, printing JSON lines."""
+    programs = seidel.BinaryPrograms(binary_file_path)
+    with seidel.ParallelSeidelMethod(processes, chunk_size, seed, vectorized) as method:
+        result = method.solve_binary(programs)
+    statuses = result.statuses()
+    for i, program_id in enumerate(programs.ids().tolist()):
+        solution = result.point(i)
+        output = {"id": program_id, "status": statuses[i].name, "solution": None}
+        output["objective"] = None
+        if solution is not None:
+            output["solution"] = [solution.x + 0.0, solution.y + 0.0]
+            output["objective"] = float(result.objective[i])
+        typer.echo(json.dumps(output))
+
+
+@app.command()
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    path: Optional[str] = typer.Option(None, help="Listen on this Unix socket."),
+    max_batch: int = 256,
+    max_delay: float = 0.002,
+    workers: int = 4,
+):
+    """Solve programs sent as JSON lines over TCP or Unix socket."""
+
+    async def run():
+        server = seidel.SolveServer(max_batch, max_delay, workers)
+        listening = await server.start(host, port, path)
+        typer.echo(f"Listening on {server.address}")
+        async with listening:
+            await listening.serve_forever()
+
+    asyncio.run(run())
+
+
 if __name__ == "__main__":
-    typer.run(main)
+    app()
@@ -1,3 +1,16 @@
-from seidel.read_program import read_program
+from seidel.batch import BatchResult, BatchSeidelMethod
+from seidel.binary_program import BinaryPrograms, convert_programs
+from seidel.cache import ResultCache
+from seidel.clarkson import ClarksonMethod
+from seidel.constraint_array import ConstraintArray
+from seidel.dynamic import DynamicProgram
+from seidel.multidimensional import LinearProgramND, SeidelNDMethod
+from seidel.ordering import MoveToFront
+from seidel.parallel import ParallelSeidelMethod
+from seidel.parametric import ParametricProgram
+from seidel.polygon import FeasiblePolygon
+from seidel.read_program import iter_programs, read_program
 from seidel.seidel import SeidelMethod
+from seidel.server import SolveServer
 from seidel.solver import LinearProgram, Solver
+from seidel.verify import Verification, verify
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Union
+
+import numpy as np
+
+from .constraint_array import ConstraintArray
+from .geometric_objects import EPSILON, Point
+from .linear_program import LinearProgram, ProgramStatus, Target
+from .seidel import SeidelMethod, tightness
+from .solver import SolvingMethod
+
+# statuses of the programs are stored as indices of this list
+STATUSES = list(ProgramStatus)
+NOT_SOLVED = STATUSES.index(ProgramStatus.NOT_SOLVED)
+OPTIMAL = STATUSES.index(ProgramStatus.OPTIMAL)
+INFEASIBLE = STATUSES.index(ProgramStatus.INFEASIBLE)
+UNBOUNDED = STATUSES.index(ProgramStatus.UNBOUNDED)
+
+# constraint that is always satisfied and never intersects other lines,
+# pads the basis of programs enclosed by a single constraint
+EMPTY_CONSTRAINT = (0.0, 0.0, 1.0)
+AXES = ((-1.0, 0.0, 0.0), (0.0, -1.0, 0.0))
+
+
+@dataclass
+class BatchResult:
+    """Results of the programs solved together, in the order they were given."""
+
+    status: np.ndarray
+    solution: np.ndarray
+    objective: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def statuses(self) -> List[ProgramStatus]:
+        return [STATUSES[code] for code in self.status]
+
+    def point(self, i: int) -> Union[Point, None]:
+        if self.status[i] != OPTIMAL:
+            return None
+        return Point(float(self.solution[i, 0]), float(self.solution[i, 1]))
+
+
+class BatchSeidelMethod(SolvingMethod):
+    """Seidel method applied to many programs at once.
+
+    All programs apply their k-th constraint in the same step, so that
+    every step is a handful of numpy operations over the whole batch.
+    Programs that their constraints dont enclose with the axes are solved
+    one by one by SeidelMethod."""
+
+    def __init__(self, seed: Union[int, None] = None):
+        """Settings of this method.
+
+        Keyword arguments:
+        seed -- seed of the generator shuffling constraints of the programs
+        """
+        self.rng = np.random.default_rng(seed)
+
+    def solve(self, program: LinearProgram) -> LinearProgram:
+        coefficients = np.array(
+            [(c.x, c.y, c.b) for c in program.constraints], dtype=np.float64
+        ).reshape(1, -1, 3)
+        result = self.solve_batch(
+            np.array([[program.target.x, program.target.y]]),
+            coefficients,
+            np.array([coefficients.shape[1]]),
+        )
+        program.status = STATUSES[result.status[0]]
+        program.solution = result.point(0)
+        return program
+
+    def solve_batch(
+        self, targets: np.ndarray, constraints: np.ndarray, counts: np.ndarray
+    ) -> BatchResult:
+        """Solves the padded stack of programs.
+
+        Keyword arguments:
+        targets -- (n, 2) coefficients of the target functions
+        constraints -- (n, m, 3) coefficients A, B, C of the constraints,
+            rows past the count of the program are ignored
+        counts -- (n,) number of constraints of each program
+        """
+        targets = np.asarray(targets, dtype=np.float64)
+        constraints = np.asarray(constraints, dtype=np.float64)
+        counts = np.asarray(counts)
+        n, m, _ = constraints.shape
+        valid = np.arange(m) < counts[:, None]
+
+        # shuffle constraints of every program, padding stays at the end
+        keys = np.where(valid, self.rng.random((n, m)), np.inf)
+        order = np.argsort(keys, axis=1)
+        constraints = np.take_along_axis(constraints, order[:, :, None], axis=1)
+
+        status, solution, basis, enclosed = self.find_basic_solutions(
+            targets, constraints, valid
+        )
+
+        for k in range(m):
+            active = valid[:, k] & (status == NOT_SOLVED) & enclosed
+            a, b, c = constraints[:, k].T
+            violated = np.flatnonzero(
+                active & (a * solution[:, 0] + b * solution[:, 1] > c + EPSILON)
+            )
+            if len(violated) == 0:
+                continue
+            applied = np.concatenate(
+                [basis[violated], constraints[violated, :k]], axis=1
+            )
+            new_status, new_solution = optimize_on_lines(
+                targets[violated], constraints[violated, k], applied
+            )
+            status[violated] = new_status
+            solution[violated] = new_solution
+
+        status[(status == NOT_SOLVED) & enclosed] = OPTIMAL
+        for i in np.flatnonzero(~enclosed):
+            program = LinearProgram(
+                Target.from_coefficients(*targets[i]),
+                [],
+                positive_x=False,
+                positive_y=False,
+            )
+            arrays = ConstraintArray.from_coefficients(constraints[i, : counts[i]])
+            SeidelMethod(vectorized=True, seed=self.rng).solve_arrays(
+                program, arrays, self.rng.permutation(len(arrays))
+            )
+            status[i] = STATUSES.index(program.status)
+            if program.status == ProgramStatus.OPTIMAL:
+                solution[i] = program.solution.x, program.solution.y
+        solution[status != OPTIMAL] = np.nan
+        objective = np.einsum("ij,ij->i", targets, solution)
+        return BatchResult(status, solution, objective)
+
+    def find_basic_solutions(
+        self, targets: np.ndarray, constraints: np.ndarray, valid: np.ndarray
+    ):
+        """Vectorized `SeidelMethod.find_basic_solution`.
+
+        Returns statuses, basic solutions, (n, 4, 3) constraints that
+        enclose the programs together with the axes and the mask of
+        programs they enclose, the others are left for SeidelMethod."""
+        n = len(targets)
+        a, b, c = constraints[:, :, 0], constraints[:, :, 1], constraints[:, :, 2]
+        rows = np.arange(n)
+
+        xyminus = valid & (a > 0) & (b > 0)
+        has_xyminus = xyminus.any(axis=1)
+        xyminus_row = constraints[rows, xyminus.argmax(axis=1)]
+
+        # the tightest xminus and yminus, as in the object method,
+        # ties are broken by the offset so the shuffle doesnt matter
+        xminus = valid & (a > 0) & (b <= 0)
+        yminus = valid & (a <= 0) & (b > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xminus_ratio, xminus_offset = tightness(-b / a, a, b, c)
+            yminus_ratio, yminus_offset = tightness(-a / b, a, b, c)
+        has_pair = xminus.any(axis=1) & yminus.any(axis=1)
+        xminus_row = constraints[
+            rows, tightest_rows(xminus, xminus_ratio, xminus_offset)
+        ]
+        yminus_row = constraints[
+            rows, tightest_rows(yminus, yminus_ratio, yminus_offset)
+        ]
+        determinant = (
+            xminus_row[:, 0] * yminus_row[:, 1] - yminus_row[:, 0] * xminus_row[:, 1]
+        )
+        encloses = ~has_xyminus & has_pair & (determinant > 0)
+
+        basis = np.empty((n, 4, 3))
+        basis[:, :2] = AXES
+        basis[:, 2] = np.where(has_xyminus[:, None], xyminus_row, xminus_row)
+        basis[:, 3] = np.where(encloses[:, None], yminus_row, EMPTY_CONSTRAINT)
+        basis[~(has_xyminus | encloses), 2] = EMPTY_CONSTRAINT
+
+        enclosed = has_xyminus | encloses
+        status = np.full(n, NOT_SOLVED, dtype=np.int8)
+        solution = best_vertices(targets, basis)
+        status[enclosed & np.isnan(solution[:, 0])] = INFEASIBLE
+        return status, solution, basis, enclosed
+
+
+def tightest_rows(mask: np.ndarray, ratios: np.ndarray, offsets: np.ndarray):
+    """Vectorized `seidel.tightest` over the masked rows of every program."""
+    keys = np.where(mask, offsets, np.inf), np.where(mask, ratios, np.inf)
+    return np.lexsort(keys, axis=1)[:, 0]
+
+
+def best_vertices(targets: np.ndarray, basis: np.ndarray) -> np.ndarray:
+    """Vectorized `seidel.best_vertex` over (n, k, 3) small sets of constraints.
+
+    Programs without legal vertex get nan solution."""
+    n, k, _ = basis.shape
+    best = np.full((n, 2), np.nan)
+    best_value = np.full(n, -np.inf)
+    for i in range(k):
+        for j in range(i + 1, k):
+            a1, b1, c1 = basis[:, i].T
+            a2, b2, c2 = basis[:, j].T
+            determinant = a1 * b2 - a2 * b1
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x = (c1 * b2 - c2 * b1) / determinant
+                y = (a1 * c2 - a2 * c1) / determinant
+                slack = (
+                    basis[:, :, 2]
+                    - basis[:, :, 0] * x[:, None]
+                    - basis[:, :, 1] * y[:, None]
+                )
+                legal = (
+                    (determinant != 0)
+                    & (x >= 0)
+                    & (y >= 0)
+                    & (slack >= -EPSILON).all(axis=1)
+                )
+                value = np.where(legal, targets[:, 0] * x + targets[:, 1] * y, -np.inf)
+            better = legal & (value > best_value)
+            best_value[better] = value[better]
+            best[better, 0] = x[better]
+            best[better, 1] = y[better]
+    return best
+
+
+def optimize_on_lines(targets: np.ndarray, lines: np.ndarray, applied: np.ndarray):
+    """Vectorized `seidel.optimize_on_line`, one program per row.
+
+    Keyword arguments:
+    targets -- (v, 2) target functions
+    lines -- (v, 3) violated constraints
+    applied -- (v, k, 3) constraints applied before
+    Returns status codes and solutions (nan when not optimal)."""
+    norm = lines[:, 0] ** 2 + lines[:, 1] ** 2
+    degenerate = norm == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        origin_x = lines[:, 0] * lines[:, 2] / norm
+        origin_y = lines[:, 1] * lines[:, 2] / norm
+    direction_x = -lines[:, 1]
+    direction_y = lines[:, 0]
+
+    a, b, c = applied[:, :, 0], applied[:, :, 1], applied[:, :, 2]
+    slope = a * direction_x[:, None] + b * direction_y[:, None]
+    slack = c - a * origin_x[:, None] - b * origin_y[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bounds = slack / slope
+    upper = np.where(slope > 0, bounds, np.inf).min(axis=1)
+    lower = np.where(slope < 0, bounds, -np.inf).max(axis=1)
+    separated = ((slope == 0) & (slack < -EPSILON * norm[:, None])).any(axis=1)
+
+    with np.errstate(invalid="ignore"):
+        empty = (lower > upper) & ~np.isclose(lower, upper, rtol=EPSILON, atol=EPSILON)
+    infeasible = degenerate | separated | empty
+
+    gain = targets[:, 0] * direction_x + targets[:, 1] * direction_y
+    t = np.where(
+        gain > 0,
+        upper,
+        np.where(
+            gain < 0,
+            lower,
+            np.where(lower > -np.inf, lower, np.minimum(upper, 0.0)),
+        ),
+    )
+    unbounded = ~infeasible & np.isinf(t)
+
+    status = np.full(len(lines), NOT_SOLVED, dtype=np.int8)
+    status[unbounded] = UNBOUNDED
+    status[infeasible] = INFEASIBLE
+    with np.errstate(invalid="ignore"):
+        solution = np.stack(
+            [origin_x + t * direction_x, origin_y + t * direction_y], axis=1
+        )
+    solution[status != NOT_SOLVED] = np.nan
+    return status, solution
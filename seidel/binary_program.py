@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import struct
+from typing import Dict, Union
+
+import numpy as np
+
+from .constraint_array import ConstraintArray
+from .linear_program import LinearProgram, Target
+from .read_program import iter_program_lines
+from .seidel import SeidelMethod
+
+MAGIC = b"SEIDELLP"
+VERSION = 1
+# magic, version, number of programs, number of constraint rows,
+# offsets of coefficients, targets and table sections
+HEADER = struct.Struct("<8sIxxxxQQQQQ")
+# coefficients start at aligned offset right after the header
+COEFFICIENTS_OFFSET = 64
+TABLE_DTYPE = np.dtype([("id", "<i8"), ("start", "<i8"), ("count", "<i8")])
+
+
+def convert_programs(text_path: str, binary_path: str) -> int:
+    """Converts programs in text format (as read by `read_program`) to binary one.
+
+    Coefficients are written while the text file is read, only targets and
+    the table of programs are kept in memory. Returns number of programs."""
+    table = []
+    targets = []
+    rows = 0
+    with open(binary_path, "wb") as f:
+        f.write(bytes(COEFFICIENTS_OFFSET))
+        for id, lines in iter_program_lines(text_path):
+            targets.append([float(c) for c in lines[0].split()[:2]])
+            coefficients = np.array(
+                [[float(c) for c in line.split()[:3]] for line in lines[1:]],
+                dtype="<f8",
+            ).reshape(-1, 3)
+            f.write(coefficients.tobytes())
+            table.append((id, rows, len(coefficients)))
+            rows += len(coefficients)
+
+        targets_offset = f.tell()
+        f.write(np.array(targets, dtype="<f8").reshape(-1, 2).tobytes())
+        table_offset = f.tell()
+        f.write(np.array(table, dtype=TABLE_DTYPE).tobytes())
+
+        f.seek(0)
+        f.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                len(table),
+                rows,
+                COEFFICIENTS_OFFSET,
+                targets_offset,
+                table_offset,
+            )
+        )
+    return len(table)
+
+
+class BinaryPrograms:
+    """Programs of the binary file, memory-mapped.
+
+    Coefficients of the programs are views of the file, nothing is copied
+    until the solver gathers the constraints it needs."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size or header[:8] != MAGIC:
+            raise ValueError(f"{path} is not a binary programs file")
+        (
+            _,
+            version,
+            programs,
+            rows,
+            coefficients_offset,
+            targets_offset,
+            table_offset,
+        ) = HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"Unsupported version {version} of {path}")
+
+        self.coefficients = self._map("<f8", coefficients_offset, (rows, 3))
+        self.targets = self._map("<f8", targets_offset, (programs, 2))
+        self.table = self._map(TABLE_DTYPE, table_offset, (programs,))
+        self._rows: Union[Dict[int, int], None] = None
+
+    def _map(self, dtype, offset: int, shape) -> np.ndarray:
+        if shape[0] == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=shape)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.rows()
+
+    def rows(self) -> Dict[int, int]:
+        """Maps program ids to rows of the table."""
+        if self._rows is None:
+            self._rows = {int(id): row for row, id in enumerate(self.table["id"])}
+        return self._rows
+
+    def ids(self) -> np.ndarray:
+        return self.table["id"]
+
+    def program_coefficients(self, id: int) -> np.ndarray:
+        """(n, 3) view of A, B, C coefficients of the program constraints."""
+        _, start, count = self.table[self.rows()[id]]
+        return self.coefficients[start : start + count]
+
+    def constraints(self, id: int) -> ConstraintArray:
+        return ConstraintArray.from_coefficients(self.program_coefficients(id))
+
+    def target(self, id: int) -> Target:
+        x, y = self.targets[self.rows()[id]]
+        return Target.from_coefficients(x, y)
+
+    def solve(
+        self,
+        id: int,
+        method: Union[SeidelMethod, None] = None,
+        rng: Union[np.random.Generator, None] = None,
+    ) -> LinearProgram:
+        """Solves the program, applying its constraints in random order.
+
+        The permutation is drawn for an array of indices of the constraints."""
+        method = method or SeidelMethod(vectorized=True)
+        rng = rng or np.random.default_rng()
+        arrays = self.constraints(id)
+        program = LinearProgram(self.target(id), [])
+        return method.solve_arrays(program, arrays, rng.permutation(len(arrays)))
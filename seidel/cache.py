@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict
+from typing import Tuple, Union
+
+from .geometric_objects import DIRECTION_DIGITS, Point
+from .linear_program import LinearProgram, ProgramStatus
+
+# status and coordinates of the solution
+Entry = Tuple[ProgramStatus, Union[Tuple[float, float], None]]
+
+
+def canonical_key(program: LinearProgram) -> str:
+    """Digest of the program that doesnt change when constraints are reordered,
+    duplicated or scaled by positive factors and when the target is scaled.
+
+    Every constraint becomes its `Line.direction` with the right side
+    rounded to DIRECTION_DIGITS significant digits, the set of them is
+    sorted. None of these changes moves the optimum."""
+    constraints = set()
+    for constraint in program.constraints:
+        direction = constraint.direction()
+        if direction == (0.0, 0.0):
+            # 0x + 0y <= b only matters when it is infeasible
+            if constraint.b < 0:
+                constraints.add((0.0, 0.0, -1.0))
+            continue
+        offset = constraint.b / math.hypot(constraint.x, constraint.y)
+        constraints.add((*direction, float(f"{offset:.{DIRECTION_DIGITS}g}") + 0.0))
+
+    canonical = (program.target.direction(), sorted(constraints))
+    return hashlib.sha256(repr(canonical).encode()).hexdigest()
+
+
+class ResultCache:
+    """Results of solved programs under their `canonical_key`.
+
+    Keeps at most max_size results, the least recently used one is evicted
+    first. With a path, results are loaded from it and written by `save`."""
+
+    def __init__(self, max_size: int = 1024, path: Union[str, None] = None):
+        """Keyword arguments:
+        max_size -- number of results kept
+        path -- JSON file keeping results between runs
+        """
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.entries: OrderedDict[str, Entry] = OrderedDict()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Union[Entry, None]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, status: ProgramStatus, solution: Union[Point, None]):
+        self.entries[key] = (
+            status,
+            None if solution is None else (solution.x, solution.y),
+        )
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def load(self, path: str):
+        with open(path) as f:
+            for key, status, solution in json.load(f)["entries"]:
+                self.entries[key] = (
+                    ProgramStatus[status],
+                    None if solution is None else tuple(solution),
+                )
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def save(self, path: Union[str, None] = None):
+        """Writes the results, from the least recently used one."""
+        path = path or self.path
+        entries = [
+            [key, status.name, None if solution is None else list(solution)]
+            for key, (status, solution) in self.entries.items()
+        ]
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as f:
+            json.dump({"entries": entries}, f)
+        os.replace(temporary, path)
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from .constraint_array import ConstraintArray
+from .geometric_objects import EPSILON
+from .linear_program import Constraint, LinearProgram, ProgramStatus
+from .seidel import SeidelMethod, encloses, tightest, tightness
+from .shared import attach
+from .solver import SolvingMethod
+
+
+def _coefficients(name: str, count: int) -> np.ndarray:
+    """(count, 3) array of A, B, C rows in the shared memory segment."""
+    return np.ndarray((count, 3), dtype=np.float64, buffer=attach(name).buf)
+
+
+# key of the missing xminus or yminus candidate
+NO_CANDIDATE = (math.inf, math.inf)
+
+
+def chunk_basis(
+    name: str, count: int, start: int, stop: int
+) -> Tuple[int, int, Tuple[float, float], int, Tuple[float, float]]:
+    """Candidates for the basis among the rows [start; stop).
+
+    Returns the first row enclosing the program alone (or -1) and the rows
+    of the tightest xminus and yminus constraints with their `tightness`,
+    as in `SeidelMethod.find_basic_solution_arrays`."""
+    a, b, c = _coefficients(name, count)[start:stop].T
+    xyminus = np.flatnonzero((a > 0) & (b > 0))
+    if len(xyminus):
+        return start + int(xyminus[0]), -1, NO_CANDIDATE, -1, NO_CANDIDATE
+
+    result = [-1]
+    for rows, ratios in (
+        (np.flatnonzero((a > 0) & (b <= 0)), lambda rows: -b[rows] / a[rows]),
+        (np.flatnonzero((a <= 0) & (b > 0)), lambda rows: -a[rows] / b[rows]),
+    ):
+        if len(rows):
+            keys = tightness(ratios(rows), a[rows], b[rows], c[rows])
+            best = tightest(*keys)
+            key = (float(keys[0][best]), float(keys[1][best]))
+            result += [start + int(rows[best]), key]
+        else:
+            result += [-1, NO_CANDIDATE]
+    return tuple(result)
+
+
+def chunk_violations(
+    name: str, count: int, start: int, stop: int, x: float, y: float, limit: int
+) -> Tuple[int, np.ndarray]:
+    """Number of rows [start; stop) violated by (x, y) and up to limit of them."""
+    values = _coefficients(name, count)[start:stop] @ np.array([x, y, -1.0])
+    violated = np.flatnonzero(values > EPSILON)
+    return len(violated), start + violated[:limit]
+
+
+class ClarksonMethod(SolvingMethod):
+    """Clarkson's random sampling for programs with millions of constraints.
+
+    A sample of about 2 sqrt(n) constraints, together with the constraints
+    collected so far, is solved by the vectorized SeidelMethod. All constraints
+    are then checked against its optimum in chunks by a process pool, over
+    shared memory. When there are at most 2 sqrt(n) violators they are
+    collected, otherwise the sample is drawn again. Since every round that
+    collects violators adds a constraint of the optimal basis, a few
+    passes over the constraints are expected.
+
+    Use as a context manager or call `close` to stop the processes."""
+
+    def __init__(
+        self,
+        processes: Union[int, None] = None,
+        chunk_size: int = 1 << 20,
+        sample_size: Union[int, None] = None,
+        seed: Union[int, None] = None,
+        max_rounds: int = 64,
+        executor: Union[Executor, None] = None,
+    ):
+        """Settings of this method.
+
+        Keyword arguments:
+        processes -- size of the process pool, number of cores by default
+        chunk_size -- constraints checked by a single task
+        sample_size -- constraints sampled every round, 2 sqrt(n) by default
+        seed -- seed of the generator of the samples
+        max_rounds -- rounds before all constraints are solved at once
+        executor -- pool of the tasks, one is started on the first solve otherwise
+        """
+        self.processes = processes or os.cpu_count()
+        self.chunk_size = chunk_size
+        self.sample_size = sample_size
+        self.rng = np.random.default_rng(seed)
+        self.max_rounds = max_rounds
+        self.executor = executor
+        self._own_executor = executor is None
+        # violators found in every round of the last solve
+        self.violations: List[int] = []
+
+    def __enter__(self) -> ClarksonMethod:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._own_executor and self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def solve(self, program: LinearProgram) -> LinearProgram:
+        return self.solve_arrays(program, ConstraintArray.from_program(program))
+
+    def solve_arrays(
+        self, program: LinearProgram, arrays: ConstraintArray
+    ) -> LinearProgram:
+        """Solves the program whose constraints are stored in `arrays`.
+
+        `program.constraints` are not used."""
+        count = len(arrays)
+        segment = shared_memory.SharedMemory(create=True, size=max(1, count * 24))
+        try:
+            coefficients = np.ndarray((count, 3), dtype=np.float64, buffer=segment.buf)
+            coefficients[:, 0] = arrays.a
+            coefficients[:, 1] = arrays.b
+            coefficients[:, 2] = arrays.c
+            self.solve_shared(program, segment.name, coefficients)
+            del coefficients
+        finally:
+            segment.close()
+            segment.unlink()
+        return program
+
+    def map_chunks(self, function, name: str, count: int, *args) -> list:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.processes)
+        starts = range(0, count, self.chunk_size)
+        futures = [
+            self.executor.submit(
+                function, name, count, start, min(start + self.chunk_size, count), *args
+            )
+            for start in starts
+        ]
+        return [future.result() for future in futures]
+
+    def find_basis(
+        self, program: LinearProgram, name: str, coefficients: np.ndarray
+    ) -> np.ndarray:
+        """Rows enclosing the program with the axes. If there are none,
+        the program is solved with all rows at once."""
+        count = len(coefficients)
+        candidates = self.map_chunks(chunk_basis, name, count)
+        for xyminus, *_ in candidates:
+            if xyminus >= 0:
+                return np.array([xyminus])
+
+        none = (-1, -1, NO_CANDIDATE, -1, NO_CANDIDATE)
+        xminus_row = min(candidates, key=lambda c: c[2], default=none)[1]
+        yminus_row = min(candidates, key=lambda c: c[4], default=none)[3]
+        xminus = yminus = None
+        if xminus_row >= 0:
+            xminus = Constraint.from_coefficients(*coefficients[xminus_row])
+        if yminus_row >= 0:
+            yminus = Constraint.from_coefficients(*coefficients[yminus_row])
+        if xminus is not None and yminus is not None and encloses(xminus, yminus):
+            return np.array([xminus_row, yminus_row])
+        self.solve_rows(program, coefficients, np.arange(count))
+        return np.array([], dtype=np.intp)
+
+    def solve_rows(self, program: LinearProgram, coefficients: np.ndarray, rows):
+        """Solves the program restricted to the rows, in random order."""
+        arrays = ConstraintArray.from_coefficients(coefficients[rows])
+        SeidelMethod(vectorized=True).solve_arrays(
+            program, arrays, self.rng.permutation(len(arrays))
+        )
+
+    def solve_shared(self, program: LinearProgram, name: str, coefficients: np.ndarray):
+        count = len(coefficients)
+        self.violations = []
+        program.status = ProgramStatus.NOT_SOLVED
+        program.solution = None
+        collected = self.find_basis(program, name, coefficients)
+        if program.status != ProgramStatus.NOT_SOLVED:
+            return
+
+        sample_size = self.sample_size or int(2 * math.sqrt(count)) + 1
+        limit = int(2 * math.sqrt(count)) + 1
+        for _ in range(self.max_rounds):
+            sample = self.rng.integers(0, count, min(sample_size, count))
+            program.status = ProgramStatus.NOT_SOLVED
+            self.solve_rows(program, coefficients, np.union1d(collected, sample))
+            if program.status != ProgramStatus.OPTIMAL:
+                # infeasible subset makes all constraints infeasible
+                return
+
+            x, y = program.solution.x, program.solution.y
+            results = self.map_chunks(chunk_violations, name, count, x, y, limit)
+            violations = sum(violated for violated, _ in results)
+            self.violations.append(violations)
+            if violations == 0:
+                return
+            if violations <= limit:
+                collected = np.union1d(
+                    collected, np.concatenate([rows for _, rows in results])
+                )
+
+        # unlucky samples, fall back to a single solve of all constraints
+        program.status = ProgramStatus.NOT_SOLVED
+        self.solve_rows(program, coefficients, np.arange(count))
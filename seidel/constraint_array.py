@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from .geometric_objects import EPSILON
+from .linear_program import Constraint, LinearProgram
+
+
+class ConstraintArray:
+    """Columnar storage of 'less than or equal' constraints Ax + By <= C.
+
+    Keeps A, B and C coefficients in float arrays so that predicates
+    are evaluated for all of the constraints at once."""
+
+    def __init__(self, a, b, c) -> None:
+        self.a = np.asarray(a, dtype=np.float64)
+        self.b = np.asarray(b, dtype=np.float64)
+        self.c = np.asarray(c, dtype=np.float64)
+
+    @classmethod
+    def from_constraints(cls, constraints: Iterable[Constraint]) -> ConstraintArray:
+        coefficients = np.array(
+            [(constraint.x, constraint.y, constraint.b) for constraint in constraints],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        return cls.from_coefficients(coefficients)
+
+    @classmethod
+    def from_coefficients(cls, coefficients: np.ndarray) -> ConstraintArray:
+        """Wraps (n, 3) array of A, B, C rows, columns are views of it."""
+        return cls(coefficients[:, 0], coefficients[:, 1], coefficients[:, 2])
+
+    @classmethod
+    def from_program(cls, program: LinearProgram) -> ConstraintArray:
+        return cls.from_constraints(program.constraints)
+
+    def __len__(self) -> int:
+        return len(self.c)
+
+    def __repr__(self):
+        return f"ConstraintArray({len(self)} constraints)"
+
+    def take(self, indices) -> ConstraintArray:
+        return ConstraintArray(self.a[indices], self.b[indices], self.c[indices])
+
+    def append(self, constraints: Iterable[Constraint]) -> ConstraintArray:
+        """Copy of the array with the constraints added at the end."""
+        other = ConstraintArray.from_constraints(constraints)
+        return ConstraintArray(
+            np.concatenate([self.a, other.a]),
+            np.concatenate([self.b, other.b]),
+            np.concatenate([self.c, other.c]),
+        )
+
+    def constraint(self, index: int) -> Constraint:
+        return Constraint.from_coefficients(self.a[index], self.b[index], self.c[index])
+
+    def contains(self, x, y, tolerance: float = 0.0) -> np.ndarray:
+        """Returns whether the point is on the left side of each line.
+
+        Coordinates can be arrays, they are broadcast against the constraints."""
+        return self.a * x + self.b * y <= self.c + tolerance
+
+    def intersect(self, other: Constraint) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Intersects every constraint with the other one.
+
+        Returns coordinates of the intersection points and the mask of
+        constraints parallel to the other one (their coordinates are nan)."""
+        # Cramer's rule, as in Constraint.intersect for 'generic' lines
+        determinant = self.a * other.y - other.x * self.b
+        parallel = determinant == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = (self.c * other.y - other.b * self.b) / determinant
+            y = (self.a * other.b - other.x * self.c) / determinant
+        x[parallel] = np.nan
+        y[parallel] = np.nan
+        return x, y, parallel
+
+    def line_bounds(self, line: Constraint) -> Tuple[float, float]:
+        """Interval of the `line` boundary parameter allowed by all the constraints.
+
+        Uses the parametrization of `Constraint.boundary`, returns empty
+        (inf; -inf) interval when a parallel constraint doesnt overlap the line."""
+        origin_x, origin_y, direction_x, direction_y = line.boundary()
+        slope = self.a * direction_x + self.b * direction_y
+        slack = self.c - self.a * origin_x - self.b * origin_y
+
+        parallel = slope == 0
+        norm = direction_x * direction_x + direction_y * direction_y
+        if np.any(slack[parallel] < -EPSILON * norm):
+            return np.inf, -np.inf
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bounds = slack / slope
+        upper = bounds[slope > 0]
+        lower = bounds[slope < 0]
+        return (
+            float(lower.max()) if len(lower) else -np.inf,
+            float(upper.min()) if len(upper) else np.inf,
+        )
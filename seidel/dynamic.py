@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import math
+from itertools import chain
+from typing import Dict, Iterable, Set, Union
+
+from .geometric_objects import EPSILON, Point
+from .linear_program import (
+    AXIS_X,
+    AXIS_Y,
+    Constraint,
+    LinearProgram,
+    ProgramStatus,
+    Target,
+)
+from .seidel import SeidelMethod, optimize_on_line
+
+
+class DynamicProgram:
+    """Program whose constraints are inserted and deleted while it is solved.
+
+    Keeps the current optimum and its basis, at most two constraints whose
+    optimum alone is the same. Updates of n constraints cost:
+        - inserted constraint that contains the optimum, O(1),
+        - violated constraint moves the optimum onto its line, a 1D program
+          and a new basis, both found in a single O(n) pass,
+        - deleted constraint outside of the basis, O(1), even if it is tight,
+        - deleted constraint of the basis solves the program again, O(n)
+          expected, but a random constraint is in the basis with
+          probability at most 2/n.
+    Infeasible programs are solved again on every deletion and unbounded
+    ones on every insertion."""
+
+    def __init__(
+        self,
+        target: Target,
+        constraints: Iterable[Constraint] = (),
+        method: Union[SeidelMethod, None] = None,
+    ) -> None:
+        self.target = target
+        self.method = method or SeidelMethod()
+        self.constraints: Dict[int, Constraint] = {}
+        self.status = ProgramStatus.NOT_SOLVED
+        self.solution: Union[Point, None] = None
+        # handles of the constraints defining the optimum, the axes have none
+        self.basis: Set[int] = set()
+        # number of times the program was solved from scratch
+        self.resolves = 0
+        self._next_handle = 0
+        for constraint in constraints:
+            self.constraints[self._new_handle()] = constraint
+        self.resolve()
+
+    def _new_handle(self) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+        return handle
+
+    def __len__(self) -> int:
+        return len(self.constraints)
+
+    def insert(self, constraint: Constraint) -> int:
+        """Adds the constraint, returns handle used to delete it."""
+        handle = self._new_handle()
+        self.constraints[handle] = constraint
+
+        if self.status == ProgramStatus.INFEASIBLE:
+            # more constraints cant make the program feasible
+            return handle
+        if self.status == ProgramStatus.OPTIMAL:
+            if not constraint.contains(self.solution, EPSILON):
+                # the new optimum lies on the constraint line
+                self.status, self.solution = optimize_on_line(
+                    self.target,
+                    constraint,
+                    chain((AXIS_X, AXIS_Y), self.constraints.values()),
+                )
+                self.find_basis()
+            return handle
+
+        self.resolve()
+        return handle
+
+    def delete(self, handle: int) -> Constraint:
+        """Removes the constraint inserted under the handle."""
+        constraint = self.constraints.pop(handle)
+
+        if self.status == ProgramStatus.UNBOUNDED:
+            # less constraints cant bound the program
+            return constraint
+        if self.status == ProgramStatus.OPTIMAL and handle not in self.basis:
+            # the basis alone keeps the optimum
+            return constraint
+
+        self.resolve()
+        return constraint
+
+    def is_tight(self, constraint: Constraint) -> bool:
+        """Does the constraint line pass through the optimum."""
+        value = constraint.x * self.solution.x + constraint.y * self.solution.y
+        return abs(value - constraint.b) <= EPSILON * (1 + abs(constraint.b))
+
+    def find_basis(self):
+        """Finds constraints tight at the optimum whose normals are the
+        closest to the target from both sides, the target is a nonnegative
+        combination of them. If there are no such, all tight constraints
+        are kept."""
+        self.basis = set()
+        if self.status != ProgramStatus.OPTIMAL:
+            return
+        if self.target.x == 0 and self.target.y == 0:
+            # every feasible point is optimal
+            return
+        # angles between the target and the normals of tight constraints
+        tight = [
+            (
+                math.atan2(
+                    self.target.x * constraint.y - self.target.y * constraint.x,
+                    self.target.x * constraint.x + self.target.y * constraint.y,
+                ),
+                handle,
+            )
+            for handle, constraint in chain(
+                ((None, AXIS_X), (None, AXIS_Y)), self.constraints.items()
+            )
+            if self.is_tight(constraint)
+        ]
+        parallel = [handle for angle, handle in tight if abs(angle) <= EPSILON]
+        left = [(angle, handle) for angle, handle in tight if angle > EPSILON]
+        right = [(angle, handle) for angle, handle in tight if angle < -EPSILON]
+        if parallel:
+            basis = parallel[:1]
+        else:
+            basis = [handle for _, handle in tight]
+            if left and right:
+                left_angle, left_handle = min(left, key=lambda pair: pair[0])
+                right_angle, right_handle = max(right, key=lambda pair: pair[0])
+                if left_angle - right_angle < math.pi - EPSILON:
+                    basis = [left_handle, right_handle]
+        self.basis = {handle for handle in basis if handle is not None}
+
+    def resolve(self):
+        """Solves the program from scratch with current constraints."""
+        self.resolves += 1
+        program = LinearProgram(self.target, self.constraints.values())
+        self.method.solve(program)
+        self.status = program.status
+        self.solution = program.solution
+        self.find_basis()
+
+    def program(self) -> LinearProgram:
+        """Current constraints as a program, with status and solution filled."""
+        program = LinearProgram(self.target, self.constraints.values())
+        program.status = self.status
+        program.solution = self.solution
+        return program
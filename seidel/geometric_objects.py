@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from enum import Enum
+from typing import Tuple
 
 FLOAT_EQUALITY_DELTA = 0.01
+# tolerance for comparisons of values computed from intersected lines
+EPSILON = 1e-9
+# greater bounds are tried when the optimum lies on the bound, up to MAX_BOUND
+BOUND_GROWTH = 1e3
+MAX_BOUND = 1e300
+# precision of unit coefficients compared by Line.direction
+DIRECTION_DIGITS = 12
 
 
 class Side(Enum):
@@ -26,13 +35,15 @@ class Region(Enum):
     STRIPE = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class Intersection:
     point: Point
     type: IntersectionType
 
 
 class Point:
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -43,9 +54,11 @@ class Point:
         return f"({self.x}, {self.y})"
 
     def __eq__(self, other: Point) -> bool:
+        if not isinstance(other, Point):
+            return NotImplemented
         return (
-            self.x - other.x < FLOAT_EQUALITY_DELTA
-            and self.y - other.y < FLOAT_EQUALITY_DELTA
+            abs(self.x - other.x) < FLOAT_EQUALITY_DELTA
+            and abs(self.y - other.y) < FLOAT_EQUALITY_DELTA
         )
 
     def is_legal(self):
@@ -54,21 +67,40 @@ class Point:
 
 
 class Line:
+    __slots__ = ("x", "y")
+
     def __init__(self, s: str):
         coefficients = s.split(" ")
         self.x = float(coefficients[0])
         self.y = float(coefficients[1])
 
+    @classmethod
+    def from_coefficients(cls, x: float, y: float) -> Line:
+        """Builds the line without parsing a string."""
+        line = cls.__new__(cls)
+        line.x = float(x)
+        line.y = float(y)
+        return line
+
     def slope(self):
         return -1 * self.x / self.y
 
+    def direction(self) -> Tuple[float, float]:
+        """Coefficients scaled to unit length, rounded so that
+        scaled copies of the line have the same direction."""
+        norm = math.hypot(self.x, self.y)
+        if norm == 0:
+            return 0.0, 0.0
+        return (
+            round(self.x / norm, DIRECTION_DIGITS) + 0.0,
+            round(self.y / norm, DIRECTION_DIGITS) + 0.0,
+        )
+
     def is_parallel(self, other: Line) -> bool:
         """Does consider case where both coefficients
         are opposite to other line coefficients."""
-        return (self.x, self.y) == (other.x, other.y) or (self.x, self.y) == (
-            -1 * other.x,
-            -1 * other.y,
-        )
+        x, y = self.direction()
+        return other.direction() in [(x, y), (-x + 0.0, -y + 0.0)]
 
     def is_same_direction(self, other: Line) -> bool:
         return self.x * other.x >= 0 and self.y * other.y >= 0
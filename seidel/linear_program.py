@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import random
 from enum import Enum
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from .geometric_objects import Intersection, IntersectionType, Line, Point, Side
 
@@ -15,6 +14,8 @@ class ProgramStatus(Enum):
 
 
 class Target(Line):
+    __slots__ = ()
+
     def f(self, point: Point) -> float:
         if point is None:
             return None
@@ -33,11 +34,22 @@ class Target(Line):
 class Constraint(Line):
     """All constraints are 'less than or equal' inequalities."""
 
+    __slots__ = ("b",)
+
     def __init__(self, s: str):
         super().__init__(s)
         coefficients = s.split(" ")
         self.b = float(coefficients[2])
 
+    @classmethod
+    def from_coefficients(cls, x: float, y: float, b: float) -> Constraint:
+        """Builds Ax + By <= C constraint without parsing a string."""
+        constraint = cls.__new__(cls)
+        constraint.x = float(x)
+        constraint.y = float(y)
+        constraint.b = float(b)
+        return constraint
+
     def __repr__(self):
         return f"{self.x}x + {self.y}y <= {self.b}"
 
@@ -66,9 +78,14 @@ class Constraint(Line):
         """Returns solution when y is known."""
         return -1 * y * self.y / self.x + self.b / self.x
 
-    def contains(self, point) -> bool:
+    def boundary(self) -> Tuple[float, float, float, float]:
+        """Returns point of the line closest to (0, 0) and direction along the line."""
+        norm = self.x * self.x + self.y * self.y
+        return self.x * self.b / norm, self.y * self.b / norm, -self.y, self.x
+
+    def contains(self, point, tolerance: float = 0.0) -> bool:
         """Returns whether the point is on the left side of the line."""
-        return point.x * self.x + point.y * self.y <= self.b
+        return point.x * self.x + point.y * self.y <= self.b + tolerance
 
     def intersect(self, other: Constraint) -> Intersection:
         """Intersects two constraint inequalities.
@@ -139,15 +156,21 @@ class Constraint(Line):
         return Intersection(Point(x, y), IntersectionType.POINT)
 
 
-AXIS_X = Constraint("-1 0 0")
-AXIS_Y = Constraint("0 -1 0")
+AXIS_X = Constraint.from_coefficients(-1, 0, 0)
+AXIS_Y = Constraint.from_coefficients(0, -1, 0)
 
 
 class LinearProgram:
+    """Target and constraints of a program, with the result of the last solve.
+
+    Constraints are copied once, together with the axes, solvers dont change
+    them and pick the order of constraints themselves, so the same program
+    can be solved many times."""
+
     def __init__(
         self,
         target: Target,
-        constraints: List[Constraint],
+        constraints: Iterable[Constraint],
         positive_x: bool = True,
         positive_y: bool = True,
     ) -> None:
@@ -155,12 +178,11 @@ class LinearProgram:
         self.status = ProgramStatus.NOT_SOLVED
         self.solution = None
         self.target = target
-        self.constraints = constraints
+        self.constraints = list(constraints)
         if positive_x:
             self.constraints.append(AXIS_X)
         if positive_y:
             self.constraints.append(AXIS_Y)
-        random.shuffle(self.constraints)
 
     @classmethod
     def from_strings(
@@ -168,6 +190,16 @@ class LinearProgram:
     ) -> LinearProgram:
         return cls(Target(target_str), [Constraint(c) for c in constraints_strs])
 
+    def to_dict(self) -> dict:
+        """Status, solution and value of the target, ready for JSON."""
+        if self.status != ProgramStatus.OPTIMAL:
+            return {"status": self.status.name, "solution": None, "objective": None}
+        return {
+            "status": self.status.name,
+            "solution": [self.solution.x + 0.0, self.solution.y + 0.0],
+            "objective": self.target(self.solution),
+        }
+
     def __str__(self):
         if self.status == ProgramStatus.OPTIMAL:
             return (
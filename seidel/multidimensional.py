@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import math
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .geometric_objects import BOUND_GROWTH, EPSILON, MAX_BOUND
+from .linear_program import ProgramStatus
+from .solver import SolvingMethod
+
+
+class LinearProgramND:
+    """Program with any number of variables, target is maximized.
+
+    Constraints are rows A_1 ... A_d, B of 'less than or equal'
+    inequalities A_1 x_1 + ... + A_d x_d <= B."""
+
+    def __init__(
+        self,
+        target: Sequence[float],
+        constraints: Sequence[Sequence[float]],
+        positive: bool = True,
+    ) -> None:
+        self.status = ProgramStatus.NOT_SOLVED
+        self.solution: Union[Tuple[float, ...], None] = None
+        self.target = np.asarray(target, dtype=np.float64)
+        self.dimension = len(self.target)
+        constraints = np.asarray(constraints, dtype=np.float64).reshape(
+            -1, self.dimension + 1
+        )
+        if positive:
+            # x_i >= 0, as the axes of the two dimensional programs
+            axes = np.hstack([-np.eye(self.dimension), np.zeros((self.dimension, 1))])
+            constraints = np.vstack([constraints, axes])
+        self.constraints = constraints
+
+    @classmethod
+    def from_strings(
+        cls, target_str: str, constraints_strs: List[str]
+    ) -> LinearProgramND:
+        return cls(
+            [float(c) for c in target_str.split()],
+            [[float(c) for c in constraint.split()] for constraint in constraints_strs],
+        )
+
+    def value(self) -> Union[float, None]:
+        if self.solution is None:
+            return None
+        return float(self.target @ self.solution)
+
+    def __str__(self):
+        if self.status == ProgramStatus.OPTIMAL:
+            return (
+                "There is an optimal solution\n"
+                + str(self.solution)
+                + "\nThe value of target function at optimum is: "
+                + str(self.value())
+            )
+
+        else:
+            return str(self.status) + str(self.solution)
+
+
+class SeidelNDMethod(SolvingMethod):
+    """Seidel method for programs with d variables.
+
+    Every violated constraint reduces the program to d-1 variables on its
+    hyperplane, solved recursively, which takes O(d! n) expected time.
+    Variables are bounded by |x_i| <= bound. When the optimum lies on the
+    bound, the program is unbounded if the target grows along a direction
+    allowed by all constraints, otherwise it is solved again with greater
+    bounds until the optimum is inside them or the value stops growing."""
+
+    def __init__(
+        self,
+        bound: float = 1e7,
+        seed: Union[int, None] = None,
+        chunk_size: int = 256,
+    ):
+        """Settings of this method.
+
+        Keyword arguments:
+        bound -- bound of absolute values of the variables of the first solve
+        seed -- seed of the generator shuffling the constraints
+        chunk_size -- number of constraints checked at once for violation
+        """
+        self.bound = bound
+        self.rng = np.random.default_rng(seed)
+        self.chunk_size = chunk_size
+
+    def solve(self, program: LinearProgramND) -> LinearProgramND:
+        constraints = program.constraints[
+            self.rng.permutation(len(program.constraints))
+        ]
+        a, b = constraints[:, :-1], constraints[:, -1]
+        bound = self.bound
+        solution = self.solve_within(program.target, a, b, bound)
+        unbounded = False
+        if solution is not None and self.on_bound(solution, bound):
+            unbounded = self.is_unbounded(program.target, a)
+            while not unbounded and self.on_bound(solution, bound):
+                if bound * BOUND_GROWTH > MAX_BOUND:
+                    break
+                bound *= BOUND_GROWTH
+                previous = program.target @ solution
+                solution = self.solve_within(program.target, a, b, bound)
+                if math.isclose(
+                    program.target @ solution,
+                    previous,
+                    rel_tol=EPSILON,
+                    abs_tol=EPSILON,
+                ):
+                    # the optimal set is unbounded, but the value is not
+                    break
+
+        if unbounded:
+            program.status = ProgramStatus.UNBOUNDED
+            program.solution = None
+        elif solution is None:
+            program.status = ProgramStatus.INFEASIBLE
+            program.solution = None
+        else:
+            program.status = ProgramStatus.OPTIMAL
+            program.solution = tuple(float(x) + 0.0 for x in solution)
+        return program
+
+    @staticmethod
+    def on_bound(solution: np.ndarray, bound: float) -> bool:
+        return bool(np.any(np.abs(solution) >= bound * (1 - EPSILON)))
+
+    def is_unbounded(self, target: np.ndarray, a: np.ndarray) -> bool:
+        """Does the target grow along a direction d with a d <= 0.
+
+        The best such direction within |d_i| <= 1 is found by the same method."""
+        direction = self.solve_within(target, a, np.zeros(len(a)), 1.0)
+        return direction is not None and target @ direction > EPSILON * (
+            1 + np.abs(target).sum()
+        )
+
+    def solve_within(
+        self, target: np.ndarray, a: np.ndarray, b: np.ndarray, bound: float
+    ) -> Union[np.ndarray, None]:
+        """`solve_recursive` with the variables bounded by |x_i| <= bound."""
+        original, self.bound = self.bound, bound
+        try:
+            return self.solve_recursive(target, a, b)
+        finally:
+            self.bound = original
+
+    def solve_recursive(
+        self, target: np.ndarray, a: np.ndarray, b: np.ndarray
+    ) -> Union[np.ndarray, None]:
+        """Maximizes target over a x <= b within the bounding box.
+
+        Constraints are applied in the order of the rows.
+        Returns None when the program is infeasible."""
+        if len(target) == 1:
+            return self.solve_interval(target[0], a[:, 0], b)
+
+        # optimum of the bounding box alone
+        solution = np.sign(target) * self.bound
+        position = 0
+        while position < len(b):
+            chunk = slice(position, position + self.chunk_size)
+            tolerance = EPSILON * (
+                1 + np.abs(b[chunk]) + np.abs(a[chunk]) @ np.abs(solution)
+            )
+            violated = np.flatnonzero(a[chunk] @ solution > b[chunk] + tolerance)
+            if len(violated) == 0:
+                position += self.chunk_size
+                continue
+
+            position += violated[0]
+            solution = self.solve_on_hyperplane(
+                target, a[position], b[position], a[:position], b[:position]
+            )
+            if solution is None:
+                return None
+            position += 1
+        return solution
+
+    def solve_on_hyperplane(
+        self,
+        target: np.ndarray,
+        normal: np.ndarray,
+        offset: float,
+        a: np.ndarray,
+        b: np.ndarray,
+    ) -> Union[np.ndarray, None]:
+        """Optimum of the program restricted to normal x = offset.
+
+        The variable with the greatest coefficient is eliminated and
+        the program with one variable less is solved recursively."""
+        dimension = len(target)
+        k = int(np.argmax(np.abs(normal)))
+        if normal[k] == 0:
+            # 0 x <= offset was violated
+            return None
+        rest = np.arange(dimension) != k
+
+        # x_k = (offset - normal_rest x_rest) / normal_k
+        ratio = normal[rest] / normal[k]
+        # bounds of the eliminated variable become ordinary constraints
+        bounds_a = np.zeros((2, dimension))
+        bounds_a[0, k], bounds_a[1, k] = 1, -1
+        a = np.vstack([bounds_a, a])
+        b = np.concatenate([[self.bound, self.bound], b])
+
+        projected_a = a[:, rest] - np.outer(a[:, k], ratio)
+        projected_b = b - a[:, k] * offset / normal[k]
+        projected_target = target[rest] - target[k] * ratio
+
+        projected = self.solve_recursive(projected_target, projected_a, projected_b)
+        if projected is None:
+            return None
+        solution = np.empty(dimension)
+        solution[rest] = projected
+        solution[k] = (offset - normal[rest] @ projected) / normal[k]
+        return solution
+
+    def solve_interval(
+        self, target: float, a: np.ndarray, b: np.ndarray
+    ) -> Union[np.ndarray, None]:
+        """One dimensional program, a single pass over the constraints."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bounds = b / a
+        upper = min(self.bound, bounds[a > 0].min(initial=np.inf))
+        lower = max(-self.bound, bounds[a < 0].max(initial=-np.inf))
+        parallel = a == 0
+        if np.any(b[parallel] < -EPSILON):
+            return None
+        if lower > upper + EPSILON * (1 + abs(lower) + abs(upper)):
+            return None
+        return np.array([upper if target > 0 else lower])
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .constraint_array import ConstraintArray
+from .geometric_objects import EPSILON
+from .linear_program import Constraint, LinearProgram, ProgramStatus
+
+# coefficients A, B, C identify the constraint across programs
+Key = Tuple[float, float, float]
+
+
+def constraint_key(constraint: Constraint) -> Key:
+    return constraint.x, constraint.y, constraint.b
+
+
+class MoveToFront:
+    """Ordering policy for streams of programs sharing most constraints.
+
+    Remembers the constraints that defined the optima of recent programs
+    and applies them first in the next programs, the remaining constraints
+    keep their random order. When consecutive programs share the optimum,
+    it is found right after the basic solution and the rest of the
+    constraints dont violate it, so the worst case bound of random order
+    is kept while most violations are avoided."""
+
+    def __init__(self, size: int = 8):
+        """Keyword arguments:
+        size -- number of remembered constraints
+        """
+        self.size = size
+        # from the least recently defining constraint
+        self.recent: OrderedDict[Key, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.recent)
+
+    def reorder(
+        self, constraints: Sequence[Constraint], order: List[int]
+    ) -> Tuple[List[int], int]:
+        """Order of `SeidelMethod.solve` with the remembered constraints first,
+        the most recent one first. Returns it with number of moved ones."""
+        if not self.recent:
+            return order, 0
+        ranks = {key: rank for rank, key in enumerate(self.recent)}
+        found = []
+        rest = []
+        for i in order:
+            rank = ranks.get(constraint_key(constraints[i]))
+            if rank is None:
+                rest.append(i)
+            else:
+                found.append((-rank, i))
+        found.sort()
+        return [i for _, i in found] + rest, len(found)
+
+    def reorder_indices(
+        self, arrays: ConstraintArray, order: np.ndarray
+    ) -> Tuple[np.ndarray, int]:
+        """Order of `SeidelMethod.solve_arrays` with the remembered constraints
+        first, the most recent one first. Returns it with number of moved ones."""
+        if not self.recent:
+            return order, 0
+        a, b, c = arrays.a[order], arrays.b[order], arrays.c[order]
+        ranks = np.full(len(order), -1)
+        for rank, (x, y, offset) in enumerate(self.recent):
+            ranks[(a == x) & (b == y) & (c == offset)] = rank
+        found = np.flatnonzero(ranks >= 0)
+        found = found[np.argsort(-ranks[found], kind="stable")]
+        return np.concatenate([order[found], order[ranks < 0]]), len(found)
+
+    def record(self, program: LinearProgram, candidates: Iterable[Constraint]):
+        """Remembers candidates tight at the optimum of the solved program,
+        or the last candidate if the program has none."""
+        candidates = list(candidates)
+        if program.status == ProgramStatus.OPTIMAL:
+            x, y = program.solution.x, program.solution.y
+            defining = [
+                c
+                for c in candidates
+                if abs(c.x * x + c.y * y - c.b) <= EPSILON * (1 + abs(c.b))
+            ]
+        else:
+            defining = candidates[-1:]
+        for constraint in defining:
+            key = constraint_key(constraint)
+            self.recent[key] = None
+            self.recent.move_to_end(key)
+        while len(self.recent) > self.size:
+            self.recent.popitem(last=False)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Union
+
+import numpy as np
+
+from .batch import NOT_SOLVED, STATUSES, BatchResult
+from .binary_program import BinaryPrograms
+from .constraint_array import ConstraintArray
+from .linear_program import Constraint, LinearProgram, Target
+from .seidel import SeidelMethod
+from .shared import attach
+from .solver import SolvingMethod
+
+# sections of a block, in the order they are laid out in the segment,
+# with their dtype and the shape of a single program or constraint row
+SECTIONS = (
+    ("coefficients", np.float64, (3,)),
+    ("targets", np.float64, (2,)),
+    # first row and number of constraints of every program
+    ("table", np.int64, (2,)),
+    ("solution", np.float64, (2,)),
+    ("status", np.int64, ()),
+)
+
+
+def block_size(programs: int, rows: int) -> int:
+    """Bytes of a block of the programs with rows of constraints in total."""
+    return 8 * (3 * rows + 7 * programs)
+
+
+def block_arrays(buffer, programs: int, rows: int) -> Dict[str, np.ndarray]:
+    """Views of the sections of the block stored in the buffer."""
+    arrays = {}
+    offset = 0
+    for name, dtype, shape in SECTIONS:
+        length = rows if name == "coefficients" else programs
+        arrays[name] = np.ndarray(
+            (length, *shape), dtype=dtype, buffer=buffer, offset=offset
+        )
+        offset += arrays[name].nbytes
+    return arrays
+
+
+def solve_chunk(
+    name: str,
+    programs: int,
+    rows: int,
+    start: int,
+    stop: int,
+    seed: Union[int, None],
+    vectorized: bool,
+):
+    """Solves the programs [start; stop) of the block, runs in a worker.
+
+    Results are written to the solution and status sections. The order of
+    the constraints depends only on the seed and the chunk, not on the worker."""
+    block = block_arrays(attach(name).buf, programs, rows)
+    coefficients, targets, table = (
+        block["coefficients"],
+        block["targets"],
+        block["table"],
+    )
+    rng = np.random.default_rng(None if seed is None else [seed, start])
+    method = SeidelMethod(vectorized=vectorized, seed=rng)
+    for i in range(start, stop):
+        first, count = table[i]
+        target = Target.from_coefficients(*targets[i])
+        rows_of_program = coefficients[first : first + count]
+        if vectorized:
+            program = LinearProgram(target, [])
+            method.solve_arrays(
+                program,
+                ConstraintArray.from_coefficients(rows_of_program),
+                rng.permutation(count),
+            )
+        else:
+            program = LinearProgram(
+                target,
+                (
+                    Constraint.from_coefficients(*row)
+                    for row in rows_of_program.tolist()
+                ),
+            )
+            method.solve(program)
+        block["status"][i] = STATUSES.index(program.status)
+        if program.solution is not None:
+            block["solution"][i] = program.solution.x, program.solution.y
+
+
+class ParallelSeidelMethod(SolvingMethod):
+    """Seidel method solving many independent programs in a process pool.
+
+    Coefficients of all programs are copied once to a shared memory block,
+    workers get only the range of programs to solve and write statuses
+    and solutions back to the block. Nothing is pickled per program, so
+    the throughput grows with the number of processes."""
+
+    def __init__(
+        self,
+        processes: Union[int, None] = None,
+        chunk_size: int = 256,
+        seed: Union[int, None] = None,
+        vectorized: bool = False,
+        executor: Union[Executor, None] = None,
+    ):
+        """Settings of this method.
+
+        Keyword arguments:
+        processes -- size of the process pool, number of cores by default
+        chunk_size -- programs solved by a single task
+        seed -- seed of the orders of constraints, results dont depend on processes
+        vectorized -- solve every program by the vectorized SeidelMethod,
+            faster for programs with thousands of constraints
+        executor -- pool of the tasks, one is started on the first solve otherwise
+        """
+        self.processes = processes or os.cpu_count()
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.vectorized = vectorized
+        self.executor = executor
+        self._own_executor = executor is None
+
+    def __enter__(self) -> ParallelSeidelMethod:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._own_executor and self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def solve(self, program: LinearProgram) -> LinearProgram:
+        coefficients = ConstraintArray.from_program(program)
+        result = self.solve_blocks(
+            np.array([[program.target.x, program.target.y]]),
+            np.column_stack([coefficients.a, coefficients.b, coefficients.c]),
+            np.array([len(coefficients)]),
+        )
+        program.status = STATUSES[result.status[0]]
+        program.solution = result.point(0)
+        return program
+
+    def solve_binary(self, programs: BinaryPrograms) -> BatchResult:
+        """Solves all programs of the binary file, in the order of its table."""
+        return self.solve_blocks(
+            programs.targets,
+            programs.coefficients,
+            programs.table["count"],
+            programs.table["start"],
+        )
+
+    def solve_blocks(
+        self,
+        targets: np.ndarray,
+        coefficients: np.ndarray,
+        counts: np.ndarray,
+        starts: Union[np.ndarray, None] = None,
+    ) -> BatchResult:
+        """Solves the programs whose constraints are consecutive rows of coefficients.
+
+        Keyword arguments:
+        targets -- (n, 2) coefficients of the target functions
+        coefficients -- (rows, 3) coefficients A, B, C of the constraints
+        counts -- (n,) number of constraints of each program
+        starts -- (n,) first row of each program, by default the programs
+            follow each other
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        if starts is None:
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+        programs, rows = len(counts), len(coefficients)
+        segment = shared_memory.SharedMemory(
+            create=True, size=max(1, block_size(programs, rows))
+        )
+        try:
+            block = block_arrays(segment.buf, programs, rows)
+            block["coefficients"][:] = coefficients
+            block["targets"][:] = targets
+            block["table"][:, 0] = starts
+            block["table"][:, 1] = counts
+            block["solution"][:] = np.nan
+            block["status"][:] = NOT_SOLVED
+            self.map_chunks(segment.name, programs, rows)
+            status = block["status"].astype(np.intp)
+            solution = block["solution"].copy()
+            del block
+        finally:
+            segment.close()
+            segment.unlink()
+
+        targets = np.asarray(targets, dtype=np.float64).reshape(-1, 2)
+        objective = np.einsum("ij,ij->i", targets, solution)
+        return BatchResult(status, solution, objective)
+
+    def map_chunks(self, name: str, programs: int, rows: int):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.processes)
+        futures = [
+            self.executor.submit(
+                solve_chunk,
+                name,
+                programs,
+                rows,
+                start,
+                min(start + self.chunk_size, programs),
+                self.seed,
+                self.vectorized,
+            )
+            for start in range(0, programs, self.chunk_size)
+        ]
+        for future in futures:
+            future.result()
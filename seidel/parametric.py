@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable, List, Tuple, Union
+
+import numpy as np
+
+from .constraint_array import ConstraintArray
+from .geometric_objects import EPSILON, Point
+from .linear_program import (
+    AXIS_X,
+    AXIS_Y,
+    Constraint,
+    LinearProgram,
+    ProgramStatus,
+    Target,
+)
+from .seidel import SeidelMethod
+
+
+class ParametricProgram:
+    """Program whose right sides C of the constraints change between solves.
+
+    The optimum is the vertex of two basis constraints i, j whose normals
+    span a cone containing the target. It moves linearly with C_i and C_j
+    and stays the optimum as long as it satisfies the other constraints,
+    so every C has a range where the basis doesnt change:
+        - C_k of other constraints can grow freely and fall to A_k x + B_k y,
+        - C_i and C_j can move until the vertex reaches another constraint.
+    Changes inside the ranges update the optimum in O(1), others solve the
+    program again.
+
+    Constraints are indexed in the given order, the axes follow them."""
+
+    def __init__(
+        self,
+        target: Target,
+        constraints: Union[Iterable[Constraint], ConstraintArray],
+        method: Union[SeidelMethod, None] = None,
+        seed: Union[int, None] = None,
+    ) -> None:
+        self.target = target
+        if not isinstance(constraints, ConstraintArray):
+            constraints = ConstraintArray.from_constraints(constraints)
+        axes = ConstraintArray.from_constraints([AXIS_X, AXIS_Y])
+        self.coefficients = np.column_stack(
+            [
+                np.concatenate([constraints.a, axes.a]),
+                np.concatenate([constraints.b, axes.b]),
+                np.concatenate([constraints.c, axes.c]),
+            ]
+        )
+        self.method = method or SeidelMethod(vectorized=True)
+        self.rng = np.random.default_rng(seed)
+        self.status = ProgramStatus.NOT_SOLVED
+        self.solution: Union[Point, None] = None
+        # number of times the program was solved from scratch
+        self.resolves = 0
+        self.basis: Tuple[int, int] = (-1, -1)
+        # dual values of the basis constraints, target = sum of them times normals
+        self.duals: Tuple[float, float] = (0.0, 0.0)
+        # movement of the optimum per unit of C_i and C_j
+        self._moves = np.zeros((2, 2))
+        # ranges of C_i and C_j, None when they must be computed again
+        self._ranges: List[Union[Tuple[float, float], None]] = [None, None]
+        self.resolve()
+
+    def __len__(self) -> int:
+        return len(self.coefficients) - 2
+
+    def resolve(self):
+        """Solves the program from scratch with current right sides."""
+        self.resolves += 1
+        program = LinearProgram(self.target, [])
+        arrays = ConstraintArray.from_coefficients(self.coefficients)
+        self.method.solve_arrays(program, arrays, self.rng.permutation(len(arrays)))
+        self.status = program.status
+        self.solution = program.solution
+        if self.status == ProgramStatus.OPTIMAL:
+            self.find_basis()
+
+    def find_basis(self):
+        """Picks the tight constraints whose normals are the closest to the target
+        from both sides, they define the optimum."""
+        a, b, c = self.coefficients.T
+        x, y = self.solution.x, self.solution.y
+        tight = np.flatnonzero(
+            (np.abs(a * x + b * y - c) <= EPSILON * (1 + np.abs(c)))
+            & ((a != 0) | (b != 0))
+        )
+        # angles of the normals from the target
+        cross = self.target.x * b[tight] - self.target.y * a[tight]
+        dot = self.target.x * a[tight] + self.target.y * b[tight]
+        angles = np.arctan2(cross, dot)
+        below = np.flatnonzero(angles <= 0)
+        above = np.flatnonzero(angles > 0)
+        first = below[np.argmax(angles[below])] if len(below) else None
+        second = above[np.argmin(angles[above])] if len(above) else None
+        if first is None or second is None or angles[second] - angles[first] >= math.pi:
+            # target is parallel to the normal of the optimum (or zero),
+            # any other tight constraint not parallel to it completes the basis
+            order = np.argsort(np.abs(angles))
+            first = order[0]
+            second = next(
+                k
+                for k in order[1:]
+                if a[tight[k]] * b[tight[first]] != b[tight[k]] * a[tight[first]]
+            )
+        i, j = int(tight[first]), int(tight[second])
+
+        determinant = a[i] * b[j] - a[j] * b[i]
+        self.basis = (i, j)
+        self._moves = np.array([[b[j], -a[j]], [-b[i], a[i]]]) / determinant
+        # target = duals[0] * normal_i + duals[1] * normal_j
+        self.duals = (
+            float((self.target.x * b[j] - self.target.y * a[j]) / determinant),
+            float((a[i] * self.target.y - b[i] * self.target.x) / determinant),
+        )
+        self._ranges = [None, None]
+        self.update_solution()
+
+    def update_solution(self):
+        i, j = self.basis
+        x, y = self.coefficients[[i, j], 2] @ self._moves
+        self.solution = Point(float(x) + 0.0, float(y) + 0.0)
+
+    def basis_range(self, position: int) -> Tuple[float, float]:
+        """Range of C of the basis constraint, the optimum keeps the other constraints."""
+        if self._ranges[position] is None:
+            a, b, c = self.coefficients.T
+            move = self._moves[position]
+            rate = a * move[0] + b * move[1]
+            slack = np.maximum(c - a * self.solution.x - b * self.solution.y, 0.0)
+            others = np.ones(len(c), dtype=bool)
+            others[list(self.basis)] = False
+            with np.errstate(divide="ignore", invalid="ignore"):
+                steps = slack / rate
+            current = c[self.basis[position]]
+            self._ranges[position] = (
+                float(current + steps[others & (rate < 0)].max(initial=-np.inf)),
+                float(current + steps[others & (rate > 0)].min(initial=np.inf)),
+            )
+        return self._ranges[position]
+
+    def rhs_range(self, k: int) -> Tuple[float, float]:
+        """Interval of C_k over which the basis of the optimum doesnt change."""
+        if self.status != ProgramStatus.OPTIMAL:
+            raise ValueError(f"program is not optimal: {self.status.name}")
+        if k in self.basis:
+            return self.basis_range(self.basis.index(k))
+        a, b, _ = self.coefficients[k]
+        return a * self.solution.x + b * self.solution.y, math.inf
+
+    def ranges(self) -> np.ndarray:
+        """(n, 2) array of `rhs_range` of all constraints, without the axes."""
+        a, b, _ = self.coefficients[: len(self)].T
+        ranges = np.column_stack(
+            [a * self.solution.x + b * self.solution.y, np.full(len(self), np.inf)]
+        )
+        for position, k in enumerate(self.basis):
+            if k < len(self):
+                ranges[k] = self.basis_range(position)
+        return ranges
+
+    def active(self) -> List[int]:
+        """Indices of the constraints defining the optimum, without the axes."""
+        return [k for k in self.basis if k < len(self)]
+
+    def shadow_price(self, k: int) -> float:
+        """Change of the optimal value per unit of C_k, inside its range."""
+        if k in self.basis:
+            return self.duals[self.basis.index(k)]
+        return 0.0
+
+    def set_rhs(self, k: int, value: float) -> bool:
+        """Changes C_k, returns whether the optimum was updated without a solve."""
+        if self.status != ProgramStatus.OPTIMAL:
+            self.coefficients[k, 2] = value
+            self.resolve()
+            return False
+
+        a, b, _ = self.coefficients[k]
+        if k in self.basis:
+            position = self.basis.index(k)
+            lower, upper = self.basis_range(position)
+            if not lower <= value <= upper:
+                self.coefficients[k, 2] = value
+                self.resolve()
+                return False
+            self.coefficients[k, 2] = value
+            self.update_solution()
+            # the optimum moved, the range of the other one is computed again
+            self._ranges[1 - position] = None
+            return True
+
+        if a * self.solution.x + b * self.solution.y > value + EPSILON:
+            self.coefficients[k, 2] = value
+            self.resolve()
+            return False
+        self.coefficients[k, 2] = value
+        # the slack of k may only shorten ranges of the basis constraints
+        slack = max(value - a * self.solution.x - b * self.solution.y, 0.0)
+        for position, range_ in enumerate(self._ranges):
+            if range_ is None:
+                continue
+            move = self._moves[position]
+            rate = a * move[0] + b * move[1]
+            current = self.coefficients[self.basis[position], 2]
+            if rate > 0:
+                range_ = (range_[0], min(range_[1], current + slack / rate))
+            elif rate < 0:
+                range_ = (max(range_[0], current + slack / rate), range_[1])
+            self._ranges[position] = range_
+        return True
+
+    def program(self) -> LinearProgram:
+        """Current constraints as a program, with status and solution filled."""
+        program = LinearProgram(
+            self.target,
+            [
+                Constraint.from_coefficients(*row)
+                for row in self.coefficients[: len(self)]
+            ],
+        )
+        program.status = self.status
+        program.solution = self.solution
+        return program
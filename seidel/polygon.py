@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+from .batch import INFEASIBLE, OPTIMAL, UNBOUNDED, BatchResult
+from .constraint_array import ConstraintArray
+from .geometric_objects import EPSILON, Point
+from .linear_program import (
+    AXIS_X,
+    AXIS_Y,
+    Constraint,
+    LinearProgram,
+    ProgramStatus,
+    Target,
+)
+
+# x coordinates of the breakpoints and (slope, intercept) of the lines between
+Envelope = Tuple[np.ndarray, np.ndarray]
+
+
+def min_envelope(lines: np.ndarray, start: float, stop: float) -> Envelope:
+    """Minimum of the (n, 2) lines y = slope x + intercept on [start; stop].
+
+    Breakpoints are increasing, there is one line more than breakpoints."""
+    # from the steepest line, which is the lowest at -inf
+    lines = lines[np.lexsort((lines[:, 1], -lines[:, 0]))]
+    hull = []
+    breakpoints = []
+    for slope, intercept in lines.tolist():
+        if hull and hull[-1][0] == slope:
+            # parallel to the previous one, which is lower
+            continue
+        while hull:
+            x = (intercept - hull[-1][1]) / (hull[-1][0] - slope)
+            if breakpoints and x <= breakpoints[-1]:
+                # the last line is below both neighbours nowhere
+                hull.pop()
+                breakpoints.pop()
+            else:
+                break
+        if hull:
+            breakpoints.append(x)
+        hull.append((slope, intercept))
+
+    breakpoints = np.array(breakpoints)
+    hull = np.array(hull).reshape(-1, 2)
+    first = np.searchsorted(breakpoints, start, side="right")
+    last = max(first, np.searchsorted(breakpoints, stop, side="left"))
+    return breakpoints[first:last], hull[first : last + 1]
+
+
+def envelope_values(envelope: Envelope, xs: np.ndarray) -> np.ndarray:
+    breakpoints, lines = envelope
+    line = lines[np.searchsorted(breakpoints, xs, side="left")]
+    return line[:, 0] * xs + line[:, 1]
+
+
+class FeasiblePolygon:
+    """Feasible region of the constraints, computed once to maximize many targets.
+
+    The region lies between the lower envelope L of the constraints bounding
+    y from below and the upper envelope U of those bounding it from above,
+    over the interval of x where L(x) <= U(x). Both envelopes are built in
+    O(n log n), each target is then maximized in O(log n) time by a binary
+    search over the directions of the edges.
+
+    Vertices go counterclockwise. Unbounded region is a chain of vertices
+    entered along `rays[0]` and left along `rays[1]`."""
+
+    def __init__(self, arrays: ConstraintArray):
+        self.feasible = True
+        self.vertices = np.empty((0, 2))
+        self.rays: Union[Tuple[np.ndarray, np.ndarray], None] = None
+        # directions of the edges leaving every vertex, unwrapped
+        self.angles = np.empty(0)
+
+        axes = ConstraintArray.from_constraints([AXIS_X, AXIS_Y])
+        a, b, c = (
+            np.concatenate([axes.a, arrays.a]),
+            np.concatenate([axes.b, arrays.b]),
+            np.concatenate([axes.c, arrays.c]),
+        )
+        if np.any((a == 0) & (b == 0) & (c < 0)):
+            # 0 <= c
+            self.feasible = False
+            return
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lines = np.column_stack([-a / b, c / b])
+            bounds = c / a
+        vertical = b == 0
+        start = bounds[vertical & (a < 0)].max(initial=0.0)
+        stop = bounds[vertical & (a > 0)].min(initial=np.inf)
+        if start > stop + EPSILON * (1 + abs(start) + abs(stop)):
+            self.feasible = False
+            return
+        self.build(float(start), float(max(start, stop)), lines[b < 0], lines[b > 0])
+
+    @classmethod
+    def from_constraints(cls, constraints: Iterable[Constraint]) -> FeasiblePolygon:
+        return cls(ConstraintArray.from_constraints(constraints))
+
+    @classmethod
+    def from_program(cls, program: LinearProgram) -> FeasiblePolygon:
+        return cls.from_constraints(program.constraints)
+
+    def build(self, start: float, stop: float, lower: np.ndarray, upper: np.ndarray):
+        # maximum of the lower bounds is minimum of the negated ones
+        breakpoints, lines = min_envelope(-lower, start, stop)
+        lower = breakpoints, -lines
+        upper = min_envelope(upper, start, stop) if len(upper) else None
+
+        # U - L is concave, so it is non negative on an interval
+        xs = np.unique(
+            np.concatenate([[start], lower[0], [] if upper is None else upper[0]])
+        )
+        if stop < math.inf:
+            xs = np.append(xs, stop)
+        low = envelope_values(lower, xs)
+        if upper is None:
+            gaps = np.full(len(xs), np.inf)
+            tolerance = np.zeros(len(xs))
+        else:
+            high = envelope_values(upper, xs)
+            gaps = high - low
+            tolerance = EPSILON * (1 + np.abs(high) + np.abs(low))
+        if stop < math.inf or upper is None:
+            slope_at_end = 0.0
+        else:
+            slope_at_end = upper[1][-1, 0] - lower[1][-1, 0]
+
+        feasible = np.flatnonzero(gaps >= -tolerance)
+        if len(feasible):
+            first, last = feasible[0], feasible[-1]
+            left = xs[first]
+            if first > 0:
+                left = self.crossing(
+                    xs[first - 1], xs[first], gaps[first - 1], gaps[first]
+                )
+            if last < len(xs) - 1:
+                right = self.crossing(
+                    xs[last + 1], xs[last], gaps[last + 1], gaps[last]
+                )
+            elif stop < math.inf:
+                right = stop
+            elif slope_at_end >= 0:
+                right = math.inf
+            else:
+                right = xs[-1] + max(0.0, gaps[-1]) / -slope_at_end
+        elif slope_at_end > 0:
+            # U - L grows to be non negative after the last breakpoint
+            left = xs[-1] - gaps[-1] / slope_at_end
+            right = math.inf
+        else:
+            self.feasible = False
+            return
+
+        def inner(breakpoints: np.ndarray) -> np.ndarray:
+            return breakpoints[(left < breakpoints) & (breakpoints < right)]
+
+        ends = [left, right] if right < math.inf else [left]
+        bottom = np.concatenate([[left], inner(lower[0]), ends[1:]])
+        vertices = np.column_stack([bottom, envelope_values(lower, bottom)])
+        if upper is not None:
+            top = np.concatenate([ends[1:], inner(upper[0])[::-1], [left]])
+            top_vertices = np.column_stack([top, envelope_values(upper, top)])
+            if right < math.inf:
+                vertices = np.vstack([vertices, top_vertices])
+            else:
+                # entered along the upper envelope from the right
+                vertices = np.vstack([top_vertices, vertices])
+                self.rays = (
+                    -self.direction(upper[1][-1, 0]),
+                    self.direction(lower[1][-1, 0]),
+                )
+        else:
+            self.rays = (
+                np.array([0.0, -1.0]),
+                np.array([0.0, 1.0])
+                if right < math.inf
+                else self.direction(lower[1][-1, 0]),
+            )
+
+        self.vertices = self.deduplicate(vertices, self.rays is None)
+        self.angles = self.edge_angles()
+
+    @staticmethod
+    def crossing(outside: float, inside: float, outside_gap, inside_gap) -> float:
+        """Point between the breakpoints where U - L falls to zero."""
+        inside_gap = max(0.0, inside_gap)
+        return inside + (outside - inside) * inside_gap / (inside_gap - outside_gap)
+
+    @staticmethod
+    def direction(slope: float) -> np.ndarray:
+        norm = math.hypot(1.0, slope)
+        return np.array([1.0 / norm, slope / norm])
+
+    @staticmethod
+    def deduplicate(vertices: np.ndarray, closed: bool) -> np.ndarray:
+        """Drops vertices equal to the previous ones, e.g. where L(x) = U(x)."""
+        following = np.roll(vertices, -1, axis=0) if closed else vertices[1:]
+        tolerance = EPSILON * (
+            1 + np.abs(vertices[: len(following)]) + np.abs(following)
+        )
+        same = np.all(
+            np.abs(vertices[: len(following)] - following) <= tolerance, axis=1
+        )
+        keep = np.ones(len(vertices), dtype=bool)
+        keep[: len(following)] = ~same
+        if not keep.any():
+            # every vertex is the same point
+            keep[0] = True
+        return vertices[keep]
+
+    def edge_angles(self) -> np.ndarray:
+        """Directions of the edges, non decreasing as the edges turn left.
+
+        The first one of an unbounded region is the direction it is entered."""
+        edges = np.diff(self.vertices, axis=0)
+        if self.rays is None:
+            edges = np.vstack([edges, self.vertices[:1] - self.vertices[-1:]])
+        else:
+            edges = np.vstack([self.rays[0], edges, self.rays[1]])
+        if len(self.vertices) == 1 and self.rays is None:
+            return np.empty(0)
+        raw = np.arctan2(edges[:, 1], edges[:, 0])
+        turns = np.mod(np.diff(raw), 2 * math.pi)
+        # straight angles turned by a rounding error
+        turns[turns > 2 * math.pi - 1e-9] = 0.0
+        return raw[0] + np.concatenate([[0.0], np.cumsum(turns)])
+
+    def unbounded(self, targets: np.ndarray) -> np.ndarray:
+        """Do the targets grow along a ray of the region."""
+        if self.rays is None:
+            return np.zeros(len(targets), dtype=bool)
+        tolerance = EPSILON * np.abs(targets).sum(axis=1)
+        return (targets @ -self.rays[0] > tolerance) | (
+            targets @ self.rays[1] > tolerance
+        )
+
+    def best_vertices(self, targets: np.ndarray) -> np.ndarray:
+        """Indices of the vertices maximizing the targets."""
+        if len(self.angles) == 0:
+            return np.zeros(len(targets), dtype=np.intp)
+        # edges leaving the optimum turn away from the target
+        normal = np.arctan2(targets[:, 1], targets[:, 0]) + math.pi / 2
+        normal = self.angles[0] + np.mod(normal - self.angles[0], 2 * math.pi)
+        if self.rays is None:
+            return np.searchsorted(self.angles, normal) % len(self.vertices)
+        leaving = self.angles[1:]
+        return np.minimum(np.searchsorted(leaving, normal), len(self.vertices) - 1)
+
+    def maximize_many(self, targets: np.ndarray) -> BatchResult:
+        """Maximizes all (n, 2) targets over the region."""
+        targets = np.asarray(targets, dtype=np.float64).reshape(-1, 2)
+        n = len(targets)
+        if not self.feasible:
+            return BatchResult(
+                np.full(n, INFEASIBLE), np.full((n, 2), np.nan), np.full(n, np.nan)
+            )
+
+        status = np.full(n, OPTIMAL)
+        status[self.unbounded(targets)] = UNBOUNDED
+        solution = self.vertices[self.best_vertices(targets)] + 0.0
+        solution[status != OPTIMAL] = np.nan
+        objective = np.einsum("ij,ij->i", targets, solution)
+        return BatchResult(status, solution, objective)
+
+    def maximize(self, target: Target) -> Tuple[ProgramStatus, Union[Point, None]]:
+        result = self.maximize_many(np.array([[target.x, target.y]]))
+        return result.statuses()[0], result.point(0)
+
+    def solve(self, program: LinearProgram) -> LinearProgram:
+        """Fills status and solution of the program with constraints of this region."""
+        program.status, program.solution = self.maximize(program.target)
+        return program
@@ -0,0 +1,61 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from .geometric_objects import EPSILON
+from .linear_program import Constraint, LinearProgram, ProgramStatus
+
+
+@dataclass
+class PresolveResult:
+    # INFEASIBLE when presolve found it, NOT_SOLVED otherwise
+    status: ProgramStatus
+    # constraints left out of the solve
+    removed: int
+    # of them, constraints with 0x + 0y on the left side
+    trivial: int = 0
+    # and constraints with the same direction as a tighter one
+    dominated: int = 0
+    # constraints left to solve, in the order of the program
+    constraints: List[Constraint] = field(default_factory=list)
+
+
+def presolve_program(program: LinearProgram) -> PresolveResult:
+    """Finds constraints that cant change the solution of the program.
+
+    Constraints are bucketed by `Line.direction`, only the tightest one
+    of every direction is kept. Pairs of opposite directions that dont
+    overlap make the program infeasible. The program is not changed,
+    kept constraints are returned in its order."""
+    # offset and position of the tightest constraint of every direction
+    tightest: Dict[Tuple[float, float], Tuple[float, int]] = {}
+    trivial = 0
+    infeasible = False
+    for index, constraint in enumerate(program.constraints):
+        direction = constraint.direction()
+        if direction == (0.0, 0.0):
+            # 0x + 0y <= b
+            trivial += 1
+            infeasible = infeasible or constraint.b < 0
+            continue
+        # right side of the constraint with unit coefficients
+        offset = constraint.b / math.hypot(constraint.x, constraint.y)
+        if direction not in tightest or offset < tightest[direction][0]:
+            tightest[direction] = (offset, index)
+
+    for (x, y), (offset, _) in tightest.items():
+        opposite = tightest.get((-x + 0.0, -y + 0.0))
+        # x * X + y * Y <= offset and x * X + y * Y >= -opposite_offset
+        if opposite is not None and -opposite[0] > offset + EPSILON * (1 + abs(offset)):
+            infeasible = True
+
+    # positions, the same constraint object may be given more than once
+    kept = {index for _, index in tightest.values()}
+    removed = len(program.constraints) - len(kept)
+    return PresolveResult(
+        ProgramStatus.INFEASIBLE if infeasible else ProgramStatus.NOT_SOLVED,
+        removed,
+        trivial,
+        removed - trivial,
+        [c for index, c in enumerate(program.constraints) if index in kept],
+    )
@@ -1,18 +1,122 @@
+import json
+import os
+from typing import Container, Dict, Iterator, List, Tuple, Union
+
 from .linear_program import LinearProgram
 
+INDEX_SUFFIX = ".idx"
+
+# indexes already loaded by this process, by path of the programs file
+_indexes: Dict[str, Tuple[float, int, Dict[int, int]]] = {}
+
 
 def read_program(id: int, path: str) -> LinearProgram:
+    offsets = program_index(path)
+    if id not in offsets:
+        raise KeyError(f"There is no program !{id} in {path}")
+
     program = []
-    with open(path, "r") as f:
-        for line in f:
-            if line.startswith("!" + str(id)):
-                break
+    with open(path, "rb") as f:
+        f.seek(offsets[id])
         for line in f:
+            line = line.decode("utf-8")
             if line.startswith("!"):
                 break
-            if line.startswith("#") or line.startswith("\n"):
+            if line.startswith("#") or not line.strip():
                 continue
             program.append(line)
 
     program = LinearProgram.from_strings(program.pop(0), program)
     return program
+
+
+def iter_programs(
+    path: str, ids: Union[Container[int], None] = None
+) -> Iterator[Tuple[int, LinearProgram]]:
+    """Yields programs of the file one by one, in the order they are stored.
+
+    Only one program is kept in memory at a time. When `ids` are given,
+    other programs are skipped without parsing."""
+    for id, lines in iter_program_lines(path, ids):
+        yield id, LinearProgram.from_strings(lines[0], lines[1:])
+
+
+def iter_program_lines(
+    path: str, ids: Union[Container[int], None] = None
+) -> Iterator[Tuple[int, List[str]]]:
+    """Yields target and constraint lines of the programs, without comments."""
+    id = None
+    program = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("!"):
+                if program:
+                    yield id, program
+                program = []
+                try:
+                    id = int(line[1:].split()[0])
+                except (IndexError, ValueError):
+                    id = None
+                continue
+            if id is None or (ids is not None and id not in ids):
+                continue
+            if line.startswith("#") or not line.strip():
+                continue
+            program.append(line)
+    if program:
+        yield id, program
+
+
+def program_index(path: str) -> Dict[int, int]:
+    """Maps program ids to byte offsets of the lines following their '!id' markers.
+
+    The index is built once and saved next to the programs file,
+    it is rebuilt when modification time or size of the file change."""
+    stat = os.stat(path)
+    cached = _indexes.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+        return cached[2]
+
+    offsets = _load_index(path, stat)
+    if offsets is None:
+        offsets = build_index(path)
+        _save_index(path, stat, offsets)
+    _indexes[path] = (stat.st_mtime, stat.st_size, offsets)
+    return offsets
+
+
+def build_index(path: str) -> Dict[int, int]:
+    offsets = {}
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            offset += len(line)
+            if line.startswith(b"!"):
+                try:
+                    id = int(line[1:].split()[0])
+                except (IndexError, ValueError):
+                    continue
+                # the first program with the id wins, as in a linear scan
+                offsets.setdefault(id, offset)
+    return offsets
+
+
+def _load_index(path: str, stat: os.stat_result):
+    try:
+        with open(path + INDEX_SUFFIX, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (index.get("mtime"), index.get("size")) != (stat.st_mtime, stat.st_size):
+        return None
+    return {int(id): offset for id, offset in index["offsets"].items()}
+
+
+def _save_index(path: str, stat: os.stat_result, offsets: Dict[int, int]):
+    index = {"mtime": stat.st_mtime, "size": stat.st_size, "offsets": offsets}
+    try:
+        with open(path + INDEX_SUFFIX, "w") as f:
+            json.dump(index, f)
+    except OSError:
+        # the index is only a cache, programs can be read without it
+        pass
@@ -0,0 +1,200 @@
+"""Robust predicates for degenerate programs.
+
+Predicates are evaluated in floating point together with a bound of the
+rounding error, only when the sign of the result is uncertain they are
+evaluated again with fractions.Fraction. Coefficients of the constraints
+are floats, so the fractions are exact and so are the decisions."""
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import Iterable, Tuple, Union
+
+from .geometric_objects import Point
+from .linear_program import Constraint, ProgramStatus, Target
+
+# relative error bound of a sum of two products and a number
+# evaluated in floating point, with a safety margin
+ERROR_BOUND = 8 * 2.0**-53
+
+
+class ExactPoint(Point):
+    """Point that remembers its exact rational coordinates."""
+
+    __slots__ = ("exact_x", "exact_y")
+
+    def __init__(self, x: Fraction, y: Fraction):
+        super().__init__(float(x), float(y))
+        self.exact_x = x
+        self.exact_y = y
+
+
+def exact_coordinates(point: Point) -> Tuple[Fraction, Fraction]:
+    if isinstance(point, ExactPoint):
+        return point.exact_x, point.exact_y
+    return Fraction(point.x), Fraction(point.y)
+
+
+def side(constraint: Constraint, point: Point) -> int:
+    """Sign of Ax + By - C, non positive when the constraint contains the point."""
+    ax = constraint.x * point.x
+    by = constraint.y * point.y
+    value = ax + by - constraint.b
+    if abs(value) > ERROR_BOUND * (abs(ax) + abs(by) + abs(constraint.b)):
+        return 1 if value > 0 else -1
+
+    x, y = exact_coordinates(point)
+    value = Fraction(constraint.x) * x + Fraction(constraint.y) * y
+    value -= Fraction(constraint.b)
+    return (value > 0) - (value < 0)
+
+
+def contains(constraint: Constraint, point: Point) -> bool:
+    return side(constraint, point) <= 0
+
+
+def cross_sign(first: Tuple[float, float], second: Tuple[float, float]) -> int:
+    """Sign of the determinant of two vectors, zero for parallel ones."""
+    left = first[0] * second[1]
+    right = first[1] * second[0]
+    value = left - right
+    if abs(value) > ERROR_BOUND * (abs(left) + abs(right)):
+        return 1 if value > 0 else -1
+    value = Fraction(first[0]) * Fraction(second[1])
+    value -= Fraction(first[1]) * Fraction(second[0])
+    return (value > 0) - (value < 0)
+
+
+def exact_intersection(first: Constraint, second: Constraint) -> ExactPoint:
+    """Intersection of the lines that are not parallel."""
+    a1, b1, c1 = Fraction(first.x), Fraction(first.y), Fraction(first.b)
+    a2, b2, c2 = Fraction(second.x), Fraction(second.y), Fraction(second.b)
+    determinant = a1 * b2 - a2 * b1
+    return ExactPoint(
+        (c1 * b2 - c2 * b1) / determinant, (a1 * c2 - a2 * c1) / determinant
+    )
+
+
+def exact_line_point(line: Constraint) -> ExactPoint:
+    """Any point of the line, the line must have a non zero coefficient."""
+    if line.x != 0:
+        return ExactPoint(Fraction(line.b) / Fraction(line.x), Fraction(0))
+    return ExactPoint(Fraction(0), Fraction(line.b) / Fraction(line.y))
+
+
+def best_vertex(
+    target: Target, constraints: Iterable[Constraint]
+) -> Union[Point, None]:
+    """Robust `seidel.best_vertex`, vertices are computed exactly."""
+    constraints = list(constraints)
+    best = None
+    best_value = None
+    for i, first in enumerate(constraints):
+        for second in constraints[i + 1 :]:
+            if cross_sign((first.x, first.y), (second.x, second.y)) == 0:
+                continue
+            point = exact_intersection(first, second)
+            if point.exact_x < 0 or point.exact_y < 0:
+                continue
+            if not all(contains(constraint, point) for constraint in constraints):
+                continue
+            value = (
+                Fraction(target.x) * point.exact_x + Fraction(target.y) * point.exact_y
+            )
+            if best is None or value > best_value:
+                best, best_value = point, value
+    return best
+
+
+class _Bound:
+    """Bound of the line parameter set by a constraint, with its error bound."""
+
+    def __init__(self, t: float, error: float, constraint: Constraint):
+        self.t = t
+        self.error = error
+        self.constraint = constraint
+
+
+def _compare(first: _Bound, second: _Bound, line: Constraint) -> int:
+    """Sign of the difference of the parameters of two bounds."""
+    difference = first.t - second.t
+    if abs(difference) > first.error + second.error:
+        return 1 if difference > 0 else -1
+
+    # exact parameters measured from the same point of the line
+    point = exact_line_point(line)
+    direction_x, direction_y = Fraction(-line.y), Fraction(line.x)
+
+    def parameter(constraint: Constraint) -> Fraction:
+        a, b = Fraction(constraint.x), Fraction(constraint.y)
+        slack = Fraction(constraint.b) - a * point.exact_x - b * point.exact_y
+        return slack / (a * direction_x + b * direction_y)
+
+    value = parameter(first.constraint) - parameter(second.constraint)
+    return (value > 0) - (value < 0)
+
+
+def optimize_on_line(
+    target: Target, line: Constraint, constraints: Iterable[Constraint]
+) -> Tuple[ProgramStatus, Union[Point, None]]:
+    """Robust `seidel.optimize_on_line`.
+
+    Keeps constraints that bound the interval of the line parameter,
+    the solution is their exact intersection with the line."""
+    if line.x == 0 and line.y == 0:
+        return ProgramStatus.INFEASIBLE, None
+
+    origin_x, origin_y, direction_x, direction_y = line.boundary()
+    normal = (line.x, line.y)
+    lower = upper = None
+    for constraint in constraints:
+        # sign of the constraint normal projected on the line direction
+        slope_sign = cross_sign(normal, (constraint.x, constraint.y))
+        if slope_sign == 0:
+            # constraint is parallel, any point of the line tells the side
+            if side(constraint, exact_line_point(line)) > 0:
+                return ProgramStatus.INFEASIBLE, None
+            continue
+
+        projected_x = constraint.x * origin_x
+        projected_y = constraint.y * origin_y
+        slack = constraint.b - projected_x - projected_y
+        slope = constraint.x * direction_x + constraint.y * direction_y
+        t = slack / slope if slope != 0 else math.inf
+        # the origin is rounded too, hence its terms count twice
+        slack_error = ERROR_BOUND * (
+            abs(constraint.b) + 2 * (abs(projected_x) + abs(projected_y))
+        )
+        slope_error = ERROR_BOUND * (
+            abs(constraint.x * direction_x) + abs(constraint.y * direction_y)
+        )
+        if abs(slope) > slope_error:
+            error = (slack_error + abs(t) * slope_error) / (abs(slope) - slope_error)
+            error += ERROR_BOUND * abs(t)
+        else:
+            error = math.inf
+
+        bound = _Bound(t, error, constraint)
+        if slope_sign > 0:
+            if upper is None or _compare(bound, upper, line) < 0:
+                upper = bound
+        elif lower is None or _compare(bound, lower, line) > 0:
+            lower = bound
+
+    if lower is not None and upper is not None and _compare(lower, upper, line) > 0:
+        return ProgramStatus.INFEASIBLE, None
+
+    gain = cross_sign(normal, (target.x, target.y))
+    if gain > 0:
+        chosen = upper
+    elif gain < 0:
+        chosen = lower
+    else:
+        # every point of the interval is optimal
+        chosen = lower or upper
+        if chosen is None:
+            return ProgramStatus.OPTIMAL, exact_line_point(line)
+
+    if chosen is None:
+        return ProgramStatus.UNBOUNDED, None
+    return ProgramStatus.OPTIMAL, exact_intersection(line, chosen.constraint)
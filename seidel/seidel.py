@@ -1,216 +1,603 @@
-from asyncio import constants
-from typing import List, Union
+import math
+import time
+from typing import Callable, Iterable, List, Tuple, Union
 
-from .geometric_objects import IntersectionType, Point, Side
-from .linear_program import AXIS_X, AXIS_Y, Constraint, LinearProgram, ProgramStatus
+import numpy as np
+
+from . import robust as exact
+from .constraint_array import ConstraintArray
+from .geometric_objects import BOUND_GROWTH, EPSILON, MAX_BOUND, Point, Side
+from .linear_program import (
+    AXIS_X,
+    AXIS_Y,
+    Constraint,
+    LinearProgram,
+    ProgramStatus,
+    Target,
+)
+from .ordering import MoveToFront
 from .solver import SolvingMethod
+from .stats import SolveStats
+
+
+def encloses(xminus: Constraint, yminus: Constraint) -> bool:
+    """Do the constraints enclose the I quart together with the axes."""
+    return xminus.x * yminus.y > yminus.x * xminus.y
+
+
+def tightness(ratio, constraint_x, constraint_y, offset):
+    """Key of xminus and yminus candidates, the smallest one is kept.
+
+    Candidates with the same ratio are parallel, the one with the smallest
+    normalized offset is the tightest, so the choice doesnt depend on
+    the order of constraints. Works on arrays too."""
+    return ratio, offset / np.hypot(constraint_x, constraint_y)
+
+
+def tightest(ratios: np.ndarray, offsets: np.ndarray) -> int:
+    """Position of the smallest `tightness` key."""
+    return int(np.lexsort((offsets, ratios))[0])
+
+
+def recession_rays(
+    xminus: Union[Constraint, None], yminus: Union[Constraint, None]
+) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """Unit directions bounding the directions in which the program, that
+    the tightest xminus and yminus dont enclose with the axes, is not bounded.
+
+    The first one is the closest to the X axis."""
+    first = (1.0, 0.0) if xminus is None else (-xminus.y, xminus.x)
+    second = (0.0, 1.0) if yminus is None else (yminus.y, -yminus.x)
+    return tuple(
+        (x / math.hypot(x, y) + 0.0, y / math.hypot(x, y) + 0.0)
+        for x, y in (first, second)
+    )
+
+
+def intersection_point(
+    first: Constraint, second: Constraint
+) -> Union[Tuple[float, float], None]:
+    """Intersection of the constraint lines by Cramer's rule, None if they are parallel."""
+    determinant = first.x * second.y - second.x * first.y
+    if determinant == 0:
+        return None
+    return (
+        (first.b * second.y - second.b * first.y) / determinant + 0.0,
+        (first.x * second.b - second.x * first.b) / determinant + 0.0,
+    )
+
+
+def best_vertex(target: Target, constraints: List[Constraint]) -> Union[Point, None]:
+    """Finds legal intersection of the constraints with the greatest value of target.
+
+    Intended for a handful of constraints enclosing the space, checks all pairs."""
+    best = None
+    best_value = -math.inf
+    for i, first in enumerate(constraints):
+        for second in constraints[i + 1 :]:
+            point = intersection_point(first, second)
+            if point is None:
+                continue
+            x, y = point
+            if x < 0 or y < 0:
+                continue
+            value = target.x * x + target.y * y
+            if value <= best_value and best is not None:
+                continue
+            if all(c.x * x + c.y * y <= c.b + EPSILON for c in constraints):
+                best, best_value = point, value
+    return None if best is None else Point(*best)
+
+
+def optimize_on_line(
+    target: Target, line: Constraint, constraints: Iterable[Constraint]
+) -> Tuple[ProgramStatus, Union[Point, None]]:
+    """Solves one dimensional program on the boundary of the `line` constraint.
+
+    The line is parametrized as p(t) = origin + t * direction, every constraint
+    narrows the [lower; upper] interval of t in a single pass.
+    Returns status of the program and the best point of the interval."""
+    if line.x == 0 and line.y == 0:
+        # 0x + 0y <= b, that was violated, can not be satisfied
+        return ProgramStatus.INFEASIBLE, None
+
+    origin_x, origin_y, direction_x, direction_y = line.boundary()
+    norm = direction_x * direction_x + direction_y * direction_y
+
+    lower = -math.inf
+    upper = math.inf
+    for constraint in constraints:
+        slope = constraint.x * direction_x + constraint.y * direction_y
+        slack = constraint.b - constraint.x * origin_x - constraint.y * origin_y
+        if slope > 0:
+            upper = min(upper, slack / slope)
+        elif slope < 0:
+            lower = max(lower, slack / slope)
+        elif slack < -EPSILON * norm:
+            # constraint is parallel and doesnt overlap the line
+            return ProgramStatus.INFEASIBLE, None
+
+    return optimize_on_interval(target, line, lower, upper)
+
+
+def optimize_on_interval(
+    target: Target, line: Constraint, lower: float, upper: float
+) -> Tuple[ProgramStatus, Union[Point, None]]:
+    """Picks the best point of the [lower; upper] interval of the `line` boundary."""
+    if lower > upper and not math.isclose(
+        lower, upper, rel_tol=EPSILON, abs_tol=EPSILON
+    ):
+        return ProgramStatus.INFEASIBLE, None
+
+    origin_x, origin_y, direction_x, direction_y = line.boundary()
+    gain = target.x * direction_x + target.y * direction_y
+    if gain > 0:
+        t = upper
+    elif gain < 0:
+        t = lower
+    else:
+        # every point of the interval is optimal
+        t = lower if lower > -math.inf else min(upper, 0.0)
+
+    if math.isinf(t):
+        return ProgramStatus.UNBOUNDED, None
+    return ProgramStatus.OPTIMAL, Point(
+        origin_x + t * direction_x, origin_y + t * direction_y
+    )
 
 
 class SeidelMethod(SolvingMethod):
     """Seidel method of solving linear programs"""
 
-    def __init__(self, initial_solution: Union[Point, None] = None):
+    def __init__(
+        self,
+        initial_solution: Union[Point, None] = None,
+        vectorized: bool = False,
+        chunk_size: int = 1024,
+        collect_stats: bool = False,
+        on_violation: Union[
+            Callable[[Constraint, LinearProgram, int], None], None
+        ] = None,
+        robust: bool = False,
+        ordering: Union[MoveToFront, None] = None,
+        seed: Union[int, np.random.Generator, None] = None,
+    ):
         """Settings of this method.
 
         Keyword arguments:
         starting_solution --
+        vectorized -- keep constraints in ConstraintArray and check them with numpy
+        chunk_size -- number of constraints checked at once by the vectorized method
+        collect_stats -- fill `stats` with SolveStats of every solve
+        on_violation -- called with the violated constraint, the program with
+            updated solution and the number of constraints applied before
+        robust -- decide violations and bounds with exact predicates,
+            slower but correct for degenerate and nearly parallel constraints
+        ordering -- MoveToFront policy applying constraints that defined
+            optima of previous programs first, for streams of similar programs
+        seed -- seed of the generator of the orders of constraints, or the generator
         """
+        if vectorized and robust:
+            raise ValueError("robust mode is not available for vectorized method")
         self.initial_solution = initial_solution
+        self.vectorized = vectorized
+        self.chunk_size = chunk_size
+        self.collect_stats = collect_stats
+        self.on_violation = on_violation
+        self.stats: Union[SolveStats, None] = None
+        self.robust = robust
+        self.ordering = ordering
+        self.rng = np.random.default_rng(seed)
+        # constraints that moved the solution during the last solve
+        self.violated: List[Constraint] = []
 
-    def find_basic_solution(self, program: LinearProgram):
+    def find_basic_solution(self, program: LinearProgram) -> List[int]:
         """To find the basic solution:
-            1. Find constraints that are enclosing the space.
+            1. Find constraints that are enclosing the space together with the axes.
             2. Use them to calculate intersection points between themselves and between them and axes.
-        Best legal point will be the basic solution.
+        Best feasible point will be the basic solution.
 
         The constraints should accept (-inf; y) and (x; -inf) 'points' to enclose the space.
         It can be a single constraint with positive coefficients or two constraints covering the 'points' separately.
+
+        Returns indices of the chosen constraints and of the axes in `program.constraints`,
+        they dont need to be applied again.
         """
+        # the program is always solved in the I quart of coordinate system,
+        # so the axes take part in every basic solution
+        self.applied.extend([AXIS_X, AXIS_Y])
+        basis = [
+            i
+            for i, constraint in enumerate(program.constraints)
+            if constraint is AXIS_X or constraint is AXIS_Y
+        ]
+
         xyminus = None
         xminus = None
         yminus = None
-        for constraint in program.constraints:
+        xminus_key = yminus_key = None
+        for i, constraint in enumerate(program.constraints):
             match constraint.sides():
                 case (Side.MINUS, Side.MINUS):
                     xyminus = constraint
+                    xyminus_index = i
                     # if there is a single constraint enclosing the program,
                     # we dont need to search for a pair
                     break
                 case (Side.MINUS, _):
-                    if yminus is None:
-                        xminus = constraint
-                    else:
-                        if yminus.intersect(constraint).type != IntersectionType.NONE:
-                            xminus = constraint
-                            break
+                    # keep the constraint that lets y grow the least with x
+                    key = tightness(
+                        -constraint.y / constraint.x,
+                        constraint.x,
+                        constraint.y,
+                        constraint.b,
+                    )
+                    if xminus is None or key < xminus_key:
+                        xminus, xminus_key = constraint, key
+                        xminus_index = i
                 case (_, Side.MINUS):
-                    if xminus is None:
-                        yminus = constraint
-                    else:
-                        if xminus.intersect(constraint).type != IntersectionType.NONE:
-                            yminus = constraint
-                            break
-        possible_solutions = []
-        # if we found single enclosing constraint, use it to calculate the two possible solutions
+                    # likewise, keep the one that lets x grow the least with y
+                    key = tightness(
+                        -constraint.x / constraint.y,
+                        constraint.x,
+                        constraint.y,
+                        constraint.b,
+                    )
+                    if yminus is None or key < yminus_key:
+                        yminus, yminus_key = constraint, key
+                        yminus_index = i
+
         if xyminus is not None:
-            # intersect the constraint with the X and Y axes
-            # no need to check intersection type
+            # single constraint encloses the program with the axes
             self.applied.append(xyminus)
-            possible_solutions.append(xyminus.intersect(AXIS_X).point)
-            possible_solutions.append(xyminus.intersect(AXIS_Y).point)
-
-            program.constraints.remove(xyminus)
+            basis.append(xyminus_index)
+        elif xminus is not None and yminus is not None and encloses(xminus, yminus):
+            # xminus and yminus cover the (-inf; y) and (x; -inf) 'points'
+            # and, as the tightest pair, close the space together with the axes
+            self.applied.append(xminus)
+            self.applied.append(yminus)
+            basis.extend([xminus_index, yminus_index])
         else:
-            # there was no constraint that encloses the program by itself
-            # we use xminus and yminus (if both exist) to cover the
-            # (-inf; y) and (x; -inf) 'points'
-
-            if xminus is None or yminus is None:
-                # the program is unbounded or infeasible, there were no two constraints that
-                # can enclose the program together,
-                # nor there was a single constraint doing this
-                # OR there the constraint pair made program infeasible
-
-                # hypothesis
-                program.status = ProgramStatus.UNBOUNDED
-                # if all below fails, this should be true
-
-                if xminus is None:
-                    # check if any constraint covers xminus
-                    # if it there is one, it was parallel to the yminus without any overlap
-                    for constraint in program.constraints:
-                        if constraint.sides()[0] == Side.MINUS:
-                            program.status = ProgramStatus.INFEASIBLE
-                            break
-                elif yminus is None:
-                    # same for yminus
-                    for constraint in program.constraints:
-                        if constraint.sides()[1] == Side.MINUS:
-                            program.status = ProgramStatus.INFEASIBLE
-                            break
-                elif xminus is None and yminus is None:
-                    # there are no constraints maybe ?
-                    pass
-
-            else:
-                # xminus and yminus exist so the program can be enclosed
-
-                # the constraints cant be parallel to the axes in first two solutions because
-                # we only check them against one axis where we assured
-                # that they arent straight in the same way
-                # ( the zero coefficient of the axis is not a zero in the constraint)
-
-                # we only care about the xminus intersection with the X axis
-                # because the Y axis intersection must be illegal
-                self.applied.append(xminus)
-                self.applied.append(yminus)
-                possible_solutions.append(xminus.intersect(self.applied[0]).point)
-                # likewise, we only care about the Y axis for yminus
-                possible_solutions.append(yminus.intersect(self.applied[1]).point)
-
-                """the third solution is the intersection of the xminus and yminus
-                this solution can have parallel lines so we cant always get intersection point
-                if this happens, there are three cases
-                    1) constraints overlap by a line (unbounded)
-                    2) constraints overlap by a stripe (unbounded)
-                    3) constraints dont overlap (infeasible)
-                cases 1) 2) are unbounded
-                case 3) is infeasible
-                constraints cant be 'almost the same' (differ only by C coefficient) in this case"""
-                intersection = yminus.intersect(xminus)
-                if intersection.type == IntersectionType.POINT:
-                    possible_solutions.append(intersection.point)
-                elif intersection.type == IntersectionType.OVERLAY:
-                    # Solution space is a line
-                    pass
-                elif intersection.type == IntersectionType.NONE:
-                    # constraints were parallel and dont overlap
-                    pass
-
-        # proceed only when there are possible solutions
-        # (the only case when there are none is when program is unbounded)
-        if len(possible_solutions) > 0:
-            # need to check if the solutions are legal
-            # ( if point.x >= 0 and point.y >= 0 )
-            legal_solutions = [sol for sol in possible_solutions if sol.is_legal()]
-
-            if len(legal_solutions) == 0:
-                # if there are no legal solutions, the program is infeasible
-                program.status = ProgramStatus.INFEASIBLE
+            self.solve_unenclosed(program, xminus, yminus)
+            return basis
+
+        self.apply_basic_solution(program)
+        return basis
+
+    def find_basic_solution_arrays(
+        self, program: LinearProgram, arrays: ConstraintArray
+    ) -> np.ndarray:
+        """Vectorized `find_basic_solution`, returns indices of the chosen constraints."""
+        self.applied.extend([AXIS_X, AXIS_Y])
+        a, b, c = arrays.a, arrays.b, arrays.c
+
+        xyminus = np.flatnonzero((a > 0) & (b > 0))
+        if len(xyminus) > 0:
+            basis = xyminus[:1]
+            self.applied.append(arrays.constraint(basis[0]))
+            self.apply_basic_solution(program)
+            return basis
+
+        xminus = yminus = None
+        xminus_rows = np.flatnonzero((a > 0) & (b <= 0))
+        if len(xminus_rows) > 0:
+            a_rows, b_rows = a[xminus_rows], b[xminus_rows]
+            xminus_row = xminus_rows[
+                tightest(*tightness(-b_rows / a_rows, a_rows, b_rows, c[xminus_rows]))
+            ]
+            xminus = arrays.constraint(xminus_row)
+        yminus_rows = np.flatnonzero((a <= 0) & (b > 0))
+        if len(yminus_rows) > 0:
+            a_rows, b_rows = a[yminus_rows], b[yminus_rows]
+            yminus_row = yminus_rows[
+                tightest(*tightness(-a_rows / b_rows, a_rows, b_rows, c[yminus_rows]))
+            ]
+            yminus = arrays.constraint(yminus_row)
+
+        if xminus is not None and yminus is not None and encloses(xminus, yminus):
+            self.applied.append(xminus)
+            self.applied.append(yminus)
+            self.apply_basic_solution(program)
+            return np.array([xminus_row, yminus_row])
+
+        self.solve_unenclosed(program, xminus, yminus, arrays)
+        return np.array([], dtype=np.intp)
+
+    def solve_unenclosed(
+        self,
+        program: LinearProgram,
+        xminus: Union[Constraint, None],
+        yminus: Union[Constraint, None],
+        arrays: Union[ConstraintArray, None] = None,
+    ):
+        """Solves the program that no constraints enclose with the axes.
+
+        If the target doesnt grow in the I quart, the axes are the basic
+        solution and the program is solved further as usual. Otherwise its
+        feasible points reach infinity between the `recession_rays` and
+        the program is unbounded when the target grows along one of them.
+        If it doesnt, the program is solved with a constraint cutting the
+        rays off, moved further until the optimum doesnt lie on it or the
+        value stops growing. Sets the status and the solution."""
+        target = program.target
+        if target.x <= 0 and target.y <= 0:
+            self.apply_basic_solution(program)
+            return
+
+        rays = recession_rays(xminus, yminus)
+        normal = (rays[0][0] + rays[1][0], rays[0][1] + rays[1][1])
+        # feasible programs have the point closest to the cut,
+        # the target -normal doesnt grow in the I quart
+        nearest = self.solve_changed(
+            program, Target.from_coefficients(-normal[0], -normal[1]), [], arrays
+        )
+        if nearest.status != ProgramStatus.OPTIMAL:
+            program.status = nearest.status
+            return
+        tolerance = EPSILON * (abs(target.x) + abs(target.y))
+        if any(target.x * x + target.y * y > tolerance for x, y in rays):
+            program.status = ProgramStatus.UNBOUNDED
+            return
+
+        bound = 1 + normal[0] * nearest.solution.x + normal[1] * nearest.solution.y
+        value = None
+        while True:
+            bound *= BOUND_GROWTH
+            cut = Constraint.from_coefficients(normal[0], normal[1], bound)
+            result = self.solve_changed(program, target, [cut], arrays)
+            if result.status != ProgramStatus.OPTIMAL:
+                program.status = result.status
+                return
+            x, y = result.solution.x, result.solution.y
+            if (
+                normal[0] * x + normal[1] * y < bound * (1 - EPSILON)
+                or bound * BOUND_GROWTH > MAX_BOUND
+                or value is not None
+                and math.isclose(
+                    target(result.solution), value, rel_tol=EPSILON, abs_tol=EPSILON
+                )
+            ):
+                # the optimal set is unbounded when the value stops growing
+                break
+            value = target(result.solution)
+        program.status = ProgramStatus.OPTIMAL
+        program.solution = result.solution
 
-            else:
-                # we now have all the legal solutions, given the current constraints
-                # now we find  the basic solution with the greatest value of target function
-                # to compare against in the iterations
-                program.solution = max(legal_solutions, key=program.target)
+    def solve_changed(
+        self,
+        program: LinearProgram,
+        target: Target,
+        extra: List[Constraint],
+        arrays: Union[ConstraintArray, None] = None,
+    ) -> LinearProgram:
+        """Solves the program with another target and extra constraints,
+        taken from `arrays` if given, by a method with the same settings."""
+        vectorized = self.vectorized or arrays is not None
+        method = SeidelMethod(
+            vectorized=vectorized,
+            chunk_size=self.chunk_size,
+            robust=self.robust and not vectorized,
+            seed=self.rng,
+        )
+        if arrays is None:
+            changed = LinearProgram(
+                target, program.constraints + extra, positive_x=False, positive_y=False
+            )
+            return method.solve(changed)
+        changed = LinearProgram(target, [], positive_x=False, positive_y=False)
+        arrays = arrays.append(extra)
+        return method.solve_arrays(changed, arrays, self.rng.permutation(len(arrays)))
+
+    def apply_basic_solution(self, program: LinearProgram):
+        """Sets the best vertex of the space enclosed by applied constraints as solution."""
+        if self.robust:
+            solution = exact.best_vertex(program.target, self.applied)
+        else:
+            solution = best_vertex(program.target, self.applied)
+        if solution is None:
+            # if there are no legal solutions, the program is infeasible
+            program.status = ProgramStatus.INFEASIBLE
+        else:
+            program.solution = solution
 
     def solve(self, program: LinearProgram) -> LinearProgram:
+        """Solves the program, applying its constraints in random order.
+
+        The order is a permutation of indices drawn from `rng`,
+        `program.constraints` are not changed."""
+        if self.vectorized:
+            arrays = ConstraintArray.from_program(program)
+            return self.solve_arrays(program, arrays, self.rng.permutation(len(arrays)))
+
         self.program = program
         self.applied: List[Constraint] = []
+        program.status = ProgramStatus.NOT_SOLVED
         program.solution = self.initial_solution if not None else Point(0, 0)
         # other starting point
         # C = 10**10
         # program.solution = Point (C/(program.target.x*2), C/(program.target.y*2))
 
-        self.find_basic_solution(program)
+        self.violated = []
+        stats = self.stats = SolveStats() if self.collect_stats else None
+        if stats is not None:
+            started = time.perf_counter()
+
+        basis = self.find_basic_solution(program)
         assert program.solution is not None or program.status in [
             ProgramStatus.INFEASIBLE,
             ProgramStatus.UNBOUNDED,
         ]
-        while (
-            len(program.constraints) > 0 and program.status == ProgramStatus.NOT_SOLVED
-        ):
-            constraint = program.constraints.pop()
-            self.apply_constraint(program, constraint)
 
-        if len(program.constraints) == 0 and program.status == ProgramStatus.NOT_SOLVED:
+        if stats is not None:
+            stats.basic_seconds = time.perf_counter() - started
+            stats.intersect_calls += len(self.applied) * (len(self.applied) - 1) // 2
+            started = time.perf_counter()
+
+        order = []
+        if program.status == ProgramStatus.NOT_SOLVED:
+            order = self.rng.permutation(len(program.constraints))
+            order = order[~np.isin(order, basis)].tolist()
+            if self.ordering is not None:
+                order, reordered = self.ordering.reorder(program.constraints, order)
+                if stats is not None:
+                    stats.reordered = reordered
+        constraints = program.constraints
+        applied = self.applied
+        count = len(order)
+        position = 0
+        while position < count and program.status == ProgramStatus.NOT_SOLVED:
+            # coordinates are read once per violation, not once per constraint
+            x, y = program.solution.x, program.solution.y
+            while position < count:
+                constraint = constraints[order[position]]
+                position += 1
+                if self.robust or constraint.x * x + constraint.y * y > (
+                    constraint.b + EPSILON
+                ):
+                    self.apply_constraint(program, constraint)
+                    break
+                applied.append(constraint)
+
+        if stats is not None:
+            stats.loop_seconds = time.perf_counter() - started
+            stats.contains_calls += position
+
+        if position == count and program.status == ProgramStatus.NOT_SOLVED:
             program.status = ProgramStatus.OPTIMAL
+        if self.ordering is not None:
+            self.ordering.record(program, self.applied[2:4] + self.violated)
 
         if program.status != ProgramStatus.OPTIMAL:
             program.solution = None
         return program
 
-    def apply_constraint(self, program, constraint):
+    def solve_arrays(
+        self,
+        program: LinearProgram,
+        arrays: ConstraintArray,
+        order: Union[np.ndarray, None] = None,
+    ) -> LinearProgram:
+        """Solves the program whose constraints are stored in `arrays`.
 
-        if constraint.contains(program.solution):
-            # the constraint doesnt change optimal solution
-            self.applied.append(constraint)
-            return
+        Constraints are applied in `order` (array of indices), by default
+        in the order they are stored. `program.constraints` are not used."""
+        self.program = program
+        self.applied: List[Constraint] = []
+        program.status = ProgramStatus.NOT_SOLVED
+        program.solution = self.initial_solution
+        self.violated = []
+
+        stats = self.stats = SolveStats() if self.collect_stats else None
+        if stats is not None:
+            started = time.perf_counter()
+
+        basis = self.find_basic_solution_arrays(program, arrays)
 
-        # the constraint changes optimal solution
+        if stats is not None:
+            stats.basic_seconds = time.perf_counter() - started
+            stats.intersect_calls += len(self.applied) * (len(self.applied) - 1) // 2
+            started = time.perf_counter()
 
-        # list of all intersections that satisfy all applied constraints
-        intersections: List[Point] = []
-        for applied in self.applied:
-            intersection = constraint.intersect(applied)
+        if program.status == ProgramStatus.NOT_SOLVED:
+            if order is None:
+                order = np.arange(len(arrays))
+            order = order[~np.isin(order, basis)]
+            if self.ordering is not None:
+                order, reordered = self.ordering.reorder_indices(arrays, order)
+                if stats is not None:
+                    stats.reordered = reordered
+            self.apply_constraints_arrays(program, arrays, order)
 
-            if intersection.type == IntersectionType.OVERLAY:
-                # if the constraints overlay, there is no need
+        if stats is not None:
+            stats.loop_seconds = time.perf_counter() - started
+
+        if program.status == ProgramStatus.NOT_SOLVED:
+            program.status = ProgramStatus.OPTIMAL
+        if self.ordering is not None:
+            self.ordering.record(program, self.applied[2:] + self.violated)
+
+        if program.status != ProgramStatus.OPTIMAL:
+            program.solution = None
+        return program
+
+    def apply_constraints_arrays(
+        self, program: LinearProgram, arrays: ConstraintArray, order: np.ndarray
+    ):
+        """Vectorized loop of `apply_constraint` calls.
+
+        Looks for the next violated constraint in chunks, the constraints
+        before it are applied without changing the solution."""
+        basis = ConstraintArray.from_constraints(self.applied)
+        position = 0
+        while position < len(order):
+            chunk = arrays.take(order[position : position + self.chunk_size])
+            violated = np.flatnonzero(
+                ~chunk.contains(program.solution.x, program.solution.y, EPSILON)
+            )
+            if len(violated) == 0:
+                if self.stats is not None:
+                    self.stats.contains_calls += len(chunk)
+                position += len(chunk)
                 continue
-            elif intersection.type == IntersectionType.NONE:
-                # constraints are parallel and dont have common region
+
+            if self.stats is not None:
+                self.stats.contains_calls += violated[0] + 1
+                self.stats.record_violation(len(basis) + position + violated[0])
+            position += violated[0]
+            constraint = arrays.constraint(order[position])
+            self.violated.append(constraint)
+            if constraint.x == 0 and constraint.y == 0:
+                # 0x + 0y <= b, that was violated, can not be satisfied
                 program.status = ProgramStatus.INFEASIBLE
-                intersections = []
-                break
+                return
+            lower, upper = basis.line_bounds(constraint)
+            applied_lower, applied_upper = arrays.take(order[:position]).line_bounds(
+                constraint
+            )
+            status, solution = optimize_on_interval(
+                program.target,
+                constraint,
+                max(lower, applied_lower),
+                min(upper, applied_upper),
+            )
+            if status != ProgramStatus.OPTIMAL:
+                program.status = status
+                return
+            program.solution = solution
+            if self.on_violation is not None:
+                self.on_violation(constraint, program, len(basis) + position)
+            position += 1
 
-            for constr in self.applied:
-                if constr.contains(intersection.point):
-                    continue
-                else:
-                    # the point didnt belong to one of applied constraints
-                    break
-            else:
-                # the point belongs to all applied constraints
-                intersections.append(intersection.point)
+    def apply_constraint(self, program, constraint):
+        if self.robust:
+            contained = exact.contains(constraint, program.solution)
+        else:
+            contained = constraint.contains(program.solution, EPSILON)
+        if contained:
+            # the constraint doesnt change optimal solution
+            self.applied.append(constraint)
+            return
 
-        if len(intersections) == 0:
-            program.status = ProgramStatus.INFEASIBLE
+        # the constraint changes optimal solution,
+        # so the new one lies on the constraint's line
+        self.violated.append(constraint)
+        if self.stats is not None:
+            self.stats.record_violation(len(self.applied))
+        if self.robust:
+            status, solution = exact.optimize_on_line(
+                program.target, constraint, self.applied
+            )
         else:
-            program.solution = intersections[0]
-            for solution in intersections:
-                if program.target(solution) > program.target(program.solution):
-                    program.solution = solution
+            status, solution = optimize_on_line(
+                program.target, constraint, self.applied
+            )
+        if status == ProgramStatus.OPTIMAL:
+            program.solution = solution
+            if self.on_violation is not None:
+                self.on_violation(constraint, program, len(self.applied))
             self.applied.append(constraint)
+        else:
+            program.status = status
 
     def __str__(self):
         if self.program.status == ProgramStatus.OPTIMAL:
@@ -0,0 +1,302 @@
+"""Asyncio service solving programs sent as JSON lines.
+
+Every request is a line with the program, for example
+
+    {"id": 7, "target": [1, 2], "constraints": [[1, 1, 4], [-1, 2, 3]]}
+
+and is answered with a line with the same id, the status, solution,
+objective and the time between receiving the request and the answer:
+
+    {"id": 7, "status": "OPTIMAL", "solution": [...], "objective": ..., "latency": ...}
+
+Line {"stats": true} is answered with the counters of the server.
+Concurrent requests are gathered into short batches which are solved
+by BatchSeidelMethod in a worker pool, off the event loop."""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from .batch import BatchResult, BatchSeidelMethod
+
+# coefficients of the target function and of the constraints
+Request = Tuple[np.ndarray, np.ndarray]
+
+
+def parse_request(target, constraints) -> Request:
+    """Coefficients of the program, raises ValueError if they are malformed."""
+    try:
+        target = np.asarray(target, dtype=np.float64)
+        constraints = np.asarray(constraints, dtype=np.float64)
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"malformed program: {error}") from None
+    if target.shape != (2,):
+        raise ValueError("target must have two coefficients")
+    if constraints.size == 0:
+        return target, np.empty((0, 3))
+    if constraints.ndim != 2 or constraints.shape[1] != 3:
+        raise ValueError("constraints must have three coefficients")
+    return target, constraints
+
+
+def solve_requests(
+    requests: List[Request], seed: Union[int, None] = None
+) -> BatchResult:
+    """Solves the programs together, runs in the worker pool."""
+    counts = np.array([len(constraints) for _, constraints in requests])
+    stacked = np.zeros((len(requests), max(1, counts.max()), 3))
+    for i, (_, constraints) in enumerate(requests):
+        stacked[i, : len(constraints)] = constraints
+    targets = np.stack([target for target, _ in requests])
+    return BatchSeidelMethod(seed).solve_batch(targets, stacked, counts)
+
+
+def fail(batch, message: str):
+    """Answers the requests of the batch, that werent answered, with ValueError."""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(ValueError(message))
+
+
+@dataclass
+class ServerStats:
+    """Counters of the server, throughput is measured since it started."""
+
+    started: float = field(default_factory=time.perf_counter)
+    received: int = 0
+    solved: int = 0
+    failed: int = 0
+    batches: int = 0
+    # requests waiting for a batch or being solved
+    pending: int = 0
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        uptime = time.perf_counter() - self.started
+        return {
+            "received": self.received,
+            "solved": self.solved,
+            "failed": self.failed,
+            "batches": self.batches,
+            "queue_depth": self.pending,
+            "uptime": uptime,
+            "throughput": self.solved / uptime if uptime > 0 else 0.0,
+        }
+
+
+class SolveServer:
+    """Solves programs of all connected clients in micro batches."""
+
+    def __init__(
+        self,
+        max_batch: int = 256,
+        max_delay: float = 0.002,
+        workers: int = 4,
+        executor: Union[Executor, None] = None,
+        seed: Union[int, None] = None,
+        limit: int = 1 << 24,
+    ):
+        """Settings of the server.
+
+        Keyword arguments:
+        max_batch -- most requests solved together
+        max_delay -- seconds the first request of a batch waits for others
+        workers -- number of threads solving batches, unless executor is given
+        executor -- pool the batches are solved in, may be a ProcessPoolExecutor
+        seed -- seed of the first batch, following ones use the next seeds
+        limit -- most bytes of a request line, longer requests are answered
+            with an error and end the connection
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.workers = workers
+        self.executor = executor
+        self.seed = seed
+        self.limit = limit
+        self.stats = ServerStats()
+        self._queue: Union[asyncio.Queue, None] = None
+        self._batcher: Union[asyncio.Task, None] = None
+        self._slots: Union[asyncio.Semaphore, None] = None
+        self._server: Union[asyncio.AbstractServer, None] = None
+        self._solving = set()
+        self._own_executor = False
+        self._closed = False
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, path: Union[str, None] = None
+    ) -> asyncio.AbstractServer:
+        """Listens on the TCP port, or on the Unix socket if path is given.
+
+        Port 0 picks a free port, see `address`."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.workers)
+            self._own_executor = True
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._batcher = asyncio.create_task(self._gather_batches())
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle, path, limit=self.limit
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, host, port, limit=self.limit
+            )
+        return self._server
+
+    @property
+    def address(self):
+        return self._server.sockets[0].getsockname()
+
+    async def close(self):
+        """Stops the server, batches being solved are answered, other
+        requests fail."""
+        self._closed = True
+        self._server.close()
+        # the batch being gathered is failed by the batcher
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        queued = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        fail(queued, "server is closed")
+        await asyncio.gather(*self._solving, return_exceptions=True)
+        await self._server.wait_closed()
+        if self._own_executor:
+            self.executor.shutdown()
+            self.executor = None
+
+    async def __aenter__(self) -> SolveServer:
+        if self._server is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def solve(self, target, constraints) -> Dict[str, Any]:
+        """Solves the program in the next batch, also usable without a socket."""
+        received = time.perf_counter()
+        if self._closed:
+            raise ValueError("server is closed")
+        request = parse_request(target, constraints)
+        self.stats.received += 1
+        self.stats.pending += 1
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        try:
+            result = await future
+        finally:
+            self.stats.pending -= 1
+        result["latency"] = time.perf_counter() - received
+        return result
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # the end of the line is lost, so are the following requests
+                    self.stats.failed += 1
+                    error = {"id": None, "error": "request is longer than the limit"}
+                    async with lock:
+                        writer.write(json.dumps(error).encode() + b"\n")
+                        await writer.drain()
+                    break
+                if not line:
+                    break
+                # requests of a client are answered as soon as they are solved
+                task = asyncio.create_task(self._answer(line, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _answer(
+        self, line: bytes, writer: asyncio.StreamWriter, lock: asyncio.Lock
+    ):
+        response: Dict[str, Any] = {}
+        try:
+            message = json.loads(line)
+            response["id"] = message.get("id")
+            if message.get("stats"):
+                response.update(self.stats.to_dict())
+            else:
+                response.update(
+                    await self.solve(message["target"], message["constraints"])
+                )
+        except KeyError as error:
+            self.stats.failed += 1
+            response["error"] = f"missing field {error}"
+        except (ValueError, AttributeError) as error:
+            self.stats.failed += 1
+            response["error"] = str(error)
+        async with lock:
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+    async def _gather_batches(self):
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = asyncio.get_running_loop().time() + self.max_delay
+                while len(batch) < self.max_batch:
+                    timeout = deadline - asyncio.get_running_loop().time()
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                # the next batch is gathered while this one is solved
+                await self._slots.acquire()
+                task = asyncio.create_task(self._solve_batch(batch))
+                self._solving.add(task)
+                task.add_done_callback(self._solving.discard)
+                batch = []
+        except asyncio.CancelledError:
+            fail(batch, "server is closed")
+            raise
+
+    async def _solve_batch(self, batch):
+        seed = None if self.seed is None else self.seed + self.stats.batches
+        self.stats.batches += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self.executor, solve_requests, [request for request, _ in batch], seed
+            )
+        except Exception as error:
+            fail(batch, f"batch failed: {error!r}")
+            return
+        finally:
+            self._slots.release()
+
+        statuses = result.statuses()
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            self.stats.solved += 1
+            solution = result.point(i)
+            future.set_result(
+                {
+                    "status": statuses[i].name,
+                    "solution": None
+                    if solution is None
+                    else [solution.x + 0.0, solution.y + 0.0],
+                    "objective": None
+                    if solution is None
+                    else float(result.objective[i]),
+                }
+            )
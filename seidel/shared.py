@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict
+
+# segments of shared memory attached by this worker process, by name
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def attach(name: str) -> shared_memory.SharedMemory:
+    """Segment created by the parent process, attached once per worker.
+
+    Workers handle a single segment at a time, attaching another one
+    closes the previous ones."""
+    if name not in _attached:
+        for segment in _attached.values():
+            segment.close()
+        _attached.clear()
+        # the creating process unlinks the segment, the tracker of this one
+        # would unlink it too when the worker exits
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args: None
+        try:
+            _attached[name] = shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+    return _attached[name]
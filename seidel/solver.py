@@ -1,9 +1,11 @@
 from abc import abstractmethod, ABC
-from typing import Tuple
+from typing import Tuple, Union
 
-from seidel.geometric_objects import Line
+from seidel.geometric_objects import Line, Point
 
-from .linear_program import LinearProgram
+from .cache import ResultCache, canonical_key
+from .linear_program import LinearProgram, ProgramStatus
+from .presolve import PresolveResult, presolve_program
 
 
 class SolvingMethod(ABC):
@@ -17,8 +19,53 @@ class SolvingMethod(ABC):
 
 
 class Solver:
-    def __init__(self, method: SolvingMethod) -> None:
+    def __init__(
+        self,
+        method: SolvingMethod,
+        presolve: bool = False,
+        cache: Union[ResultCache, None] = None,
+    ) -> None:
+        """Keyword arguments:
+        presolve -- skip duplicated and dominated constraints when solving,
+            the result is kept in `presolve_result`
+        cache -- results of programs solved before, looked up by their
+            canonical form
+        """
         self.method = method
+        self.presolve = presolve
+        self.presolve_result: Union[PresolveResult, None] = None
+        self.cache = cache
 
     def solve(self, program: LinearProgram) -> LinearProgram:
+        if self.cache is None:
+            return self.solve_uncached(program)
+
+        key = canonical_key(program)
+        entry = self.cache.get(key)
+        if entry is not None:
+            program.status, solution = entry
+            program.solution = None if solution is None else Point(*solution)
+            return program
+        self.solve_uncached(program)
+        self.cache.put(key, program.status, program.solution)
+        return program
+
+    def solve_uncached(self, program: LinearProgram) -> LinearProgram:
+        if self.presolve:
+            self.presolve_result = presolve_program(program)
+            if self.presolve_result.status == ProgramStatus.INFEASIBLE:
+                program.status = ProgramStatus.INFEASIBLE
+                program.solution = None
+                return program
+            # kept constraints are solved, the program itself doesnt change
+            reduced = LinearProgram(
+                program.target,
+                self.presolve_result.constraints,
+                positive_x=False,
+                positive_y=False,
+            )
+            self.method.solve(reduced)
+            program.status, program.solution = reduced.status, reduced.solution
+            return program
         self.method.solve(program)
+        return program
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class SolveStats:
+    """What happened during a single solve of SeidelMethod."""
+
+    # time spent finding the basic solution and in the incremental loop
+    basic_seconds: float = 0.0
+    loop_seconds: float = 0.0
+    # constraints that didnt contain the current optimum
+    violations: int = 0
+    # constraints checked against the current optimum
+    contains_calls: int = 0
+    # lines intersected, pairs for the basic solution and
+    # applied constraints for every violated line
+    intersect_calls: int = 0
+    # constraints moved to the front by the ordering policy
+    reordered: int = 0
+    # number of applied constraints at every violation
+    applied_sizes: List[int] = field(default_factory=list)
+
+    def record_violation(self, applied: int):
+        self.violations += 1
+        self.intersect_calls += applied
+        self.applied_sizes.append(applied)
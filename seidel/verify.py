@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Union
+
+import numpy as np
+
+from .constraint_array import ConstraintArray
+from .geometric_objects import EPSILON, Point
+from .linear_program import LinearProgram
+
+
+@dataclass
+class Verification:
+    """Constraints checked against every point, in the order the points were given.
+
+    Indices refer to the rows of the checked constraints."""
+
+    feasible: np.ndarray
+    # largest Ax + By - C of every point, not below 0
+    max_violation: np.ndarray
+    # number of violated constraints, all of them are in `violated` unless limited
+    violations: np.ndarray
+    violated: List[np.ndarray]
+    # constraints whose lines pass through the point
+    tight: List[np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.feasible)
+
+
+def verify(
+    constraints: Union[LinearProgram, ConstraintArray, np.ndarray],
+    points: Union[Point, np.ndarray, None] = None,
+    tolerance: float = EPSILON,
+    chunk_size: int = 1 << 16,
+    limit: Union[int, None] = None,
+) -> Verification:
+    """Checks the points against all constraints, vectorized per chunk of
+    `chunk_size` values Ax + By - C.
+
+    Constraint Ax + By <= C is violated when Ax + By - C > tolerance (1 + |C|)
+    and tight when |Ax + By - C| is within the same bound, so that optima
+    found by the solvers pass.
+
+    Keyword arguments:
+    constraints -- program (with its axes), ConstraintArray or (n, 3) array
+        of A, B, C rows, may be a memory-mapped view of `BinaryPrograms`
+    points -- Point or (k, 2) array of candidates, solution of the program
+        by default
+    tolerance -- relative tolerance of the checks
+    chunk_size -- number of values Ax + By - C computed at once, bounds
+        the memory used for very large programs
+    limit -- most violated and tight constraints reported for every point
+    """
+    if isinstance(constraints, LinearProgram):
+        if points is None:
+            points = constraints.solution
+        constraints = ConstraintArray.from_program(constraints)
+    if isinstance(points, Point):
+        points = np.array([[points.x, points.y]])
+    if points is None:
+        raise ValueError("there is no point to verify")
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if isinstance(constraints, ConstraintArray):
+        columns = constraints.a, constraints.b, constraints.c
+    else:
+        columns = constraints[:, 0], constraints[:, 1], constraints[:, 2]
+
+    count = len(points)
+    rows = max(1, chunk_size // max(1, count))
+    max_violation = np.zeros(count)
+    violations = np.zeros(count, dtype=np.intp)
+    violated = [[], []]
+    tight = [[], []]
+    for start in range(0, len(columns[2]), rows):
+        a, b, c = (np.asarray(column[start : start + rows]) for column in columns)
+        residual = np.outer(a, points[:, 0]) + np.outer(b, points[:, 1]) - c[:, None]
+        bound = tolerance * (1 + np.abs(c))[:, None]
+        max_violation = np.maximum(max_violation, residual.max(axis=0))
+        over = residual > bound
+        violations += over.sum(axis=0)
+        for found, mask in ((violated, over), (tight, np.abs(residual) <= bound)):
+            constraint, point = np.nonzero(mask)
+            found[0].append(start + constraint)
+            found[1].append(point)
+            if limit is not None:
+                _limit(found, limit)
+
+    return Verification(
+        violations == 0,
+        max_violation,
+        violations,
+        _group(violated, count),
+        _group(tight, count),
+    )
+
+
+def _limit(found, limit: int):
+    """Keeps at most limit pairs of every point, those of the first constraints."""
+    constraints, points = np.concatenate(found[0]), np.concatenate(found[1])
+    order = np.argsort(points, kind="stable")
+    grouped = points[order]
+    # position of every pair among the pairs of its point
+    rank = np.arange(len(grouped)) - np.searchsorted(grouped, grouped)
+    keep = np.sort(order[rank < limit])
+    found[0][:] = [constraints[keep]]
+    found[1][:] = [points[keep]]
+
+
+def _group(found, count: int) -> List[np.ndarray]:
+    """Splits (constraint, point) pairs into constraints of every point."""
+    constraints = np.concatenate(found[0]) if found[0] else np.empty(0, np.intp)
+    points = np.concatenate(found[1]) if found[1] else np.empty(0, np.intp)
+    order = np.argsort(points, kind="stable")
+    bounds = np.searchsorted(points[order], np.arange(count + 1))
+    constraints = constraints[order]
+    return [constraints[bounds[i] : bounds[i + 1]] for i in range(count)]
@@ -1,3 +1,5 @@
 from setuptools import setup, find_packages
 
-setup(name="seidel", version="1.0", packages=find_packages())
+setup(
+    name="seidel", version="1.0", packages=find_packages(), install_requires=["numpy"]
+)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+import seidel
+from seidel.linear_program import Constraint, LinearProgram, ProgramStatus, Target
+
+
+@pytest.mark.parametrize("id", [0, 1, 2, 3, 4, 5])
+def test_batch_method_matches_seidel_method(id):
+    expected = seidel.read_program(id, r"programs.txt")
+    seidel.Solver(seidel.SeidelMethod()).solve(expected)
+    program = seidel.read_program(id, r"programs.txt")
+    seidel.Solver(seidel.BatchSeidelMethod(seed=id)).solve(program)
+    assert program.status == expected.status
+    assert program.solution == expected.solution
+
+
+def test_solve_batch_padded_programs():
+    targets = np.array([[2, 1], [2, 1], [2, 1]])
+    constraints = np.zeros((3, 4, 3))
+    # program from the exam plus one constraint
+    constraints[0] = [(-4, 3, -2), (1, 2, 3), (2, -1, 3), (-1, 0, 0)]
+    # unbounded program, padding is ignored
+    constraints[1, :1] = [(-1, 2, 3)]
+    # infeasible program
+    constraints[2, :2] = [(-1, 2, 3), (1, -2, -4)]
+    result = seidel.BatchSeidelMethod(seed=0).solve_batch(
+        targets, constraints, np.array([4, 1, 2])
+    )
+    assert result.statuses() == [
+        ProgramStatus.OPTIMAL,
+        ProgramStatus.UNBOUNDED,
+        ProgramStatus.INFEASIBLE,
+    ]
+    assert np.allclose(result.solution[0], [1.8, 0.6])
+    assert np.isclose(result.objective[0], 4.2)
+    assert np.isnan(result.objective[1:]).all()
+    assert result.point(1) is None
+
+
+def degenerate_programs(n, seed):
+    # small integer coefficients give many parallel and repeated constraints
+    rng = np.random.default_rng(seed)
+    targets = rng.integers(-2, 3, (n, 2)).astype(float)
+    constraints = rng.integers(-3, 2, (n, 6, 3)).astype(float)
+    constraints[:, :, 2] = rng.integers(-4, 5, (n, 6))
+    return targets, constraints, rng.integers(1, 7, n)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_batch_method_matches_seidel_method_on_degenerate_programs(seed):
+    targets, constraints, counts = degenerate_programs(200, seed)
+    result = seidel.BatchSeidelMethod(seed=seed).solve_batch(
+        targets, constraints, counts
+    )
+    for i in range(200):
+        program = LinearProgram(
+            Target.from_coefficients(*targets[i]),
+            [Constraint.from_coefficients(*row) for row in constraints[i, : counts[i]]],
+        )
+        seidel.SeidelMethod(seed=seed).solve(program)
+        assert result.statuses()[i] == program.status
+        if program.status == ProgramStatus.OPTIMAL:
+            assert result.objective[i] == pytest.approx(
+                program.target(program.solution), abs=1e-9
+            )
+
+
+def test_batch_method_doesnt_depend_on_seed():
+    targets, constraints, counts = degenerate_programs(500, 4)
+    # parallel xminus candidates, infeasible whichever is chosen
+    targets[0] = -1, 1
+    constraints[0] = [(1, -1, 1), (2, -2, -2), (-1, 1, -1), (2, -2, 2)] + [
+        (0, 0, 1)
+    ] * 2
+    counts[0] = 4
+    first = seidel.BatchSeidelMethod(seed=0).solve_batch(targets, constraints, counts)
+    for seed in range(1, 6):
+        result = seidel.BatchSeidelMethod(seed=seed).solve_batch(
+            targets, constraints, counts
+        )
+        assert result.statuses()[0] == ProgramStatus.INFEASIBLE
+        assert result.status.tolist() == first.status.tolist()
+        np.testing.assert_allclose(result.objective, first.objective, atol=1e-9)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import seidel
+from seidel.linear_program import ProgramStatus
+
+
+@pytest.fixture
+def binary_programs(tmp_path):
+    path = str(tmp_path / "programs.bin")
+    assert seidel.convert_programs(r"programs.txt", path) == 6
+    return seidel.BinaryPrograms(path)
+
+
+def test_binary_programs_keep_coefficients(binary_programs):
+    assert binary_programs.ids().tolist() == [0, 1, 2, 3, 4, 5]
+    assert binary_programs.program_coefficients(1).tolist() == [
+        [-4, 3, -2],
+        [1, 2, 3],
+        [2, -1, 3],
+    ]
+    target = binary_programs.target(5)
+    assert (target.x, target.y) == (5, 3)
+    # columns are views of the mapped file
+    assert np.shares_memory(
+        binary_programs.constraints(1).a, binary_programs.coefficients
+    )
+
+
+@pytest.mark.parametrize("id", [0, 1, 2, 3, 4, 5])
+def test_binary_programs_solve(binary_programs, id):
+    expected = seidel.read_program(id, r"programs.txt")
+    seidel.Solver(seidel.SeidelMethod()).solve(expected)
+    program = binary_programs.solve(id, rng=np.random.default_rng(id))
+    assert program.status == expected.status
+    assert program.solution == expected.solution
+    if program.status == ProgramStatus.OPTIMAL:
+        assert np.isclose(
+            program.target(program.solution), expected.target(expected.solution)
+        )
+
+
+def test_binary_programs_reject_text_file():
+    with pytest.raises(ValueError):
+        seidel.BinaryPrograms(r"programs.txt")
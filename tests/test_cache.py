@@ -0,0 +1,62 @@
+import seidel
+from seidel.cache import ResultCache, canonical_key
+from seidel.linear_program import LinearProgram, ProgramStatus
+
+
+def program(target, constraints):
+    return LinearProgram.from_strings(target, constraints)
+
+
+def test_canonical_key_ignores_order_and_scale():
+    key = canonical_key(program("1 2", ["1 1 4", "-1 2 3", "3 -1 6"]))
+    assert key == canonical_key(program("2 4", ["-2 4 6", "1 1 4", "3 -1 6"]))
+    assert key == canonical_key(
+        program("0.5 1", ["3 -1 6", "2 2 8", "-1 2 3", "1 1 4"])
+    )
+    assert key != canonical_key(program("1 2", ["1 1 4", "-1 2 3", "3 -1 7"]))
+    assert key != canonical_key(program("-1 -2", ["1 1 4", "-1 2 3", "3 -1 6"]))
+
+
+def test_solver_cache_hits():
+    cache = ResultCache()
+    solver = seidel.Solver(seidel.SeidelMethod(), cache=cache)
+    solved = solver.solve(program("2 1", ["1 1 3", "1 -1 1"]))
+    cached = solver.solve(program("4 2", ["2 -2 2", "2 2 6"]))
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached.status == solved.status == ProgramStatus.OPTIMAL
+    assert (cached.solution.x, cached.solution.y) == (
+        solved.solution.x,
+        solved.solution.y,
+    )
+
+    unbounded = solver.solve(program("1 1", ["1 -1 1"]))
+    assert solver.solve(program("1 1", ["1 -1 1"])).status == unbounded.status
+    assert solver.solve(program("1 1", ["1 -1 1"])).solution is None
+    assert (cache.hits, cache.misses) == (3, 2)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResultCache(max_size=2)
+    solver = seidel.Solver(seidel.SeidelMethod(), cache=cache)
+    for bound in (1, 2, 1, 3):
+        solver.solve(program("1 1", [f"1 1 {bound}"]))
+    # 2 was used least recently
+    assert len(cache) == 2
+    solver.solve(program("1 1", ["1 1 2"]))
+    solver.solve(program("1 1", ["1 1 3"]))
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_cache_persistence(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = ResultCache(path=path)
+    seidel.Solver(seidel.SeidelMethod(), cache=cache).solve(program("1 2", ["1 1 3"]))
+    cache.save()
+
+    loaded = ResultCache(path=path)
+    result = seidel.Solver(seidel.SeidelMethod(), cache=loaded).solve(
+        program("1 2", ["1 1 3"])
+    )
+    assert loaded.hits == 1
+    assert result.status == ProgramStatus.OPTIMAL
+    assert (result.solution.x, result.solution.y) == (0.0, 3.0)
@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+import pytest
+import seidel
+from seidel.clarkson import ClarksonMethod
+from seidel.linear_program import LinearProgram, ProgramStatus, Target
+
+
+@pytest.fixture(scope="module")
+def method():
+    with ClarksonMethod(processes=2, chunk_size=4096, seed=0) as method:
+        yield method
+
+
+@pytest.mark.parametrize("id", range(6))
+def test_clarkson_agrees_with_seidel(method, id):
+    expected = seidel.read_program(id, r"programs.txt")
+    seidel.Solver(seidel.SeidelMethod()).solve(expected)
+    program = seidel.read_program(id, r"programs.txt")
+    seidel.Solver(method).solve(program)
+    assert program.status == expected.status
+    assert program.solution == expected.solution
+
+
+def test_clarkson_many_constraints(method):
+    # tangents of the unit circle, the optimum lies between the two closest to 45 degrees
+    angles = np.pi / 2 * (np.arange(20000) + 0.5) / 20000
+    arrays = seidel.ConstraintArray(np.cos(angles), np.sin(angles), np.ones(20000))
+    program = LinearProgram(Target.from_coefficients(1, 1), [])
+    method.solve_arrays(program, arrays)
+    assert program.status == ProgramStatus.OPTIMAL
+    assert program.target(program.solution) == pytest.approx(math.sqrt(2), abs=1e-8)
+    assert method.violations[-1] == 0
+
+
+def test_clarkson_solves_program_again(method):
+    program = seidel.read_program(0, r"programs.txt")
+    method.solve(program)
+    first = program.status, program.solution
+    assert first[0] == ProgramStatus.OPTIMAL
+    method.solve(program)
+    assert (program.status, program.solution) == first
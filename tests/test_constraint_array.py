@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from seidel import ConstraintArray
+from seidel.geometric_objects import IntersectionType, Point
+from seidel.linear_program import Constraint
+
+CONSTRAINTS = [
+    Constraint("-4 3 -2"),
+    Constraint("1 2 3"),
+    Constraint("2 -1 3"),
+    Constraint("0 1 2"),
+    Constraint("-1 0 0"),
+]
+
+
+def test_contains_matches_constraints():
+    arrays = ConstraintArray.from_constraints(CONSTRAINTS)
+    for point in [Point(0, 0), Point(1.8, 0.6), Point(3, 0), Point(-1, 5)]:
+        expected = [constraint.contains(point) for constraint in CONSTRAINTS]
+        assert arrays.contains(point.x, point.y).tolist() == expected
+
+
+def test_intersect_matches_constraints():
+    arrays = ConstraintArray.from_constraints(CONSTRAINTS)
+    other = Constraint("1 2 3")
+    x, y, parallel = arrays.intersect(other)
+    for i, constraint in enumerate(CONSTRAINTS):
+        intersection = constraint.intersect(other)
+        if intersection.type == IntersectionType.POINT:
+            assert not parallel[i]
+            assert np.isclose(x[i], intersection.point.x)
+            assert np.isclose(y[i], intersection.point.y)
+        else:
+            assert parallel[i]
+            assert np.isnan(x[i]) and np.isnan(y[i])
+
+
+def test_constraint_from_coefficients():
+    constraint = Constraint.from_coefficients(np.float64(1.5), -2, 0.1)
+    parsed = Constraint("1.5 -2 0.1")
+    assert (constraint.x, constraint.y, constraint.b) == (parsed.x, parsed.y, parsed.b)
+    assert type(constraint.x) is float
+    # slotted, no per instance dictionary
+    assert not hasattr(constraint, "__dict__")
+    with pytest.raises(AttributeError):
+        constraint.z = 1.0
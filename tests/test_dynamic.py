@@ -0,0 +1,91 @@
+import math
+import random
+
+import seidel
+from seidel.geometric_objects import Point
+from seidel.linear_program import Constraint, ProgramStatus, Target
+
+
+def fresh_solution(target, constraints):
+    program = seidel.LinearProgram(target, list(constraints))
+    seidel.Solver(seidel.SeidelMethod()).solve(program)
+    return program
+
+
+def test_dynamic_program_matches_fresh_solves():
+    rng = random.Random(0)
+    target = Target("2 1")
+    dynamic = seidel.DynamicProgram(target, [Constraint("1 1 10")])
+    handles = []
+    for _ in range(300):
+        if handles and rng.random() < 0.4:
+            dynamic.delete(handles.pop(rng.randrange(len(handles))))
+        else:
+            a, b = rng.uniform(-1, 3), rng.uniform(-1, 3)
+            handles.append(dynamic.insert(Constraint(f"{a} {b} {rng.uniform(1, 10)}")))
+        expected = fresh_solution(target, dynamic.constraints.values())
+        assert dynamic.status == expected.status
+        if expected.status == ProgramStatus.OPTIMAL:
+            assert math.isclose(
+                target(dynamic.solution), target(expected.solution), abs_tol=1e-9
+            )
+    # most of the updates didnt need solving from scratch
+    assert dynamic.resolves < 100
+
+
+def test_dynamic_program_fast_paths():
+    dynamic = seidel.DynamicProgram(Target("2 1"), [Constraint("1 1 3")])
+    assert dynamic.solution == Point(3, 0)
+    handle = dynamic.insert(Constraint("0 1 5"))
+    dynamic.delete(handle)
+    assert dynamic.resolves == 1
+    # violated constraint moves the optimum without solving from scratch
+    handle = dynamic.insert(Constraint("1 0 1"))
+    assert dynamic.resolves == 1
+    assert dynamic.status == ProgramStatus.OPTIMAL
+    assert math.isclose(dynamic.target(dynamic.solution), 4)
+    # deleting the constraint defining the optimum solves the program again
+    dynamic.delete(handle)
+    assert dynamic.resolves == 2
+    assert math.isclose(dynamic.target(dynamic.solution), 6)
+
+
+def test_dynamic_program_matches_fresh_solves_of_any_program():
+    # targets and constraints that leave programs unenclosed, infeasible or unbounded
+    rng = random.Random(1)
+    for _ in range(10):
+        target = Target.from_coefficients(rng.randint(-2, 2), rng.randint(-2, 2))
+        dynamic = seidel.DynamicProgram(target)
+        handles = []
+        for _ in range(60):
+            if handles and rng.random() < 0.45:
+                dynamic.delete(handles.pop(rng.randrange(len(handles))))
+            else:
+                coefficients = (
+                    rng.randint(-3, 2),
+                    rng.randint(-3, 2),
+                    rng.randint(-4, 6),
+                )
+                handles.append(
+                    dynamic.insert(Constraint.from_coefficients(*coefficients))
+                )
+            expected = fresh_solution(target, dynamic.constraints.values())
+            assert dynamic.status == expected.status
+            if expected.status == ProgramStatus.OPTIMAL:
+                assert math.isclose(
+                    target(dynamic.solution), target(expected.solution), abs_tol=1e-9
+                )
+
+
+def test_dynamic_program_keeps_optimum_without_its_tight_constraints():
+    # x + y <= 2 and y <= 1 define the optimum (1, 1), more lines pass through it
+    dynamic = seidel.DynamicProgram(
+        Target("1 2"), [Constraint("1 1 2"), Constraint("0 1 1")]
+    )
+    assert dynamic.solution == Point(1, 1)
+    handles = [dynamic.insert(Constraint(f"{k} 1 {k + 1}")) for k in range(2, 6)]
+    assert len(dynamic.basis) == 2
+    for handle in handles:
+        dynamic.delete(handle)
+    assert dynamic.resolves == 1
+    assert dynamic.solution == Point(1, 1)
@@ -0,0 +1,70 @@
+import math
+
+import pytest
+
+import seidel
+from seidel.linear_program import AXIS_X, AXIS_Y, ProgramStatus
+
+
+@pytest.mark.parametrize("id", [0, 1, 2, 3, 4, 5])
+def test_nd_method_matches_seidel_method_in_two_dimensions(id):
+    program = seidel.read_program(id, r"programs.txt")
+    program_nd = seidel.LinearProgramND(
+        [program.target.x, program.target.y],
+        [
+            [c.x, c.y, c.b]
+            for c in program.constraints
+            if c is not AXIS_X and c is not AXIS_Y
+        ],
+    )
+    seidel.Solver(seidel.SeidelMethod()).solve(program)
+    seidel.Solver(seidel.SeidelNDMethod(seed=id)).solve(program_nd)
+    assert program_nd.status == program.status
+    if program.status == ProgramStatus.OPTIMAL:
+        assert math.isclose(
+            program_nd.value(), program.target(program.solution), rel_tol=1e-9
+        )
+
+
+def test_nd_method_three_dimensions():
+    # x + y + z <= 3, x <= 1, y - z <= 0
+    program = seidel.LinearProgramND.from_strings(
+        "1 2 3", ["1 1 1 3", "1 0 0 1", "0 1 -1 0"]
+    )
+    seidel.Solver(seidel.SeidelNDMethod(seed=0)).solve(program)
+    assert program.status == ProgramStatus.OPTIMAL
+    assert program.solution == pytest.approx((0, 0, 3))
+    assert program.value() == pytest.approx(9)
+
+
+@pytest.mark.parametrize(
+    "constraints,expected_status",
+    [
+        (["1 1 0 1"], ProgramStatus.UNBOUNDED),
+        (["1 1 1 1", "-1 -1 -1 -2"], ProgramStatus.INFEASIBLE),
+    ],
+)
+def test_nd_method_statuses(constraints, expected_status):
+    program = seidel.LinearProgramND.from_strings("1 1 1", constraints)
+    seidel.Solver(seidel.SeidelNDMethod(seed=0)).solve(program)
+    assert program.status == expected_status
+    assert program.solution is None
+
+
+@pytest.mark.parametrize(
+    "target,constraints,expected",
+    [
+        # optimum beyond the first bound
+        ("1 1", ["1 0 2e7", "0 1 1"], (2e7, 1)),
+        # unbounded optimal face, bounded value
+        ("1 -1", ["1 -1 1", "1 0 5e7"], None),
+    ],
+)
+def test_nd_method_optimum_beyond_bound(target, constraints, expected):
+    program = seidel.LinearProgramND.from_strings(target, constraints)
+    seidel.Solver(seidel.SeidelNDMethod(seed=0)).solve(program)
+    assert program.status == ProgramStatus.OPTIMAL
+    if expected is None:
+        assert program.value() == pytest.approx(1)
+    else:
+        assert program.solution == pytest.approx(expected)
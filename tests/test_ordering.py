@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+import seidel
+from seidel.linear_program import Constraint, LinearProgram, ProgramStatus, Target
+from seidel.ordering import MoveToFront
+
+
+def similar_programs(count, n, seed):
+    """Tangents of the unit circle, every program changes a few of their offsets."""
+    rng = np.random.default_rng(seed)
+    angles = rng.uniform(0, 2 * np.pi, n)
+    angles[0] = np.pi / 4
+    base = np.column_stack([np.cos(angles), np.sin(angles), rng.uniform(1, 2, n)])
+    for _ in range(count):
+        coefficients = base.copy()
+        changed = rng.choice(n, n // 50, replace=False)
+        coefficients[changed, 2] += rng.uniform(-0.05, 0.05, len(changed))
+        yield coefficients
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_move_to_front_avoids_violations(vectorized):
+    target = Target.from_coefficients(1, 2)
+    rng = np.random.default_rng(0)
+    methods = [
+        seidel.SeidelMethod(vectorized=vectorized, collect_stats=True, seed=0),
+        seidel.SeidelMethod(
+            vectorized=vectorized, collect_stats=True, ordering=MoveToFront(), seed=0
+        ),
+    ]
+    violations = [0, 0]
+    for coefficients in similar_programs(20, 2000, 1):
+        values = []
+        for i, method in enumerate(methods):
+            if vectorized:
+                program = LinearProgram(target, [])
+                arrays = seidel.ConstraintArray.from_coefficients(coefficients)
+                method.solve_arrays(program, arrays, rng.permutation(len(arrays)))
+            else:
+                constraints = [
+                    Constraint.from_coefficients(*row) for row in coefficients.tolist()
+                ]
+                method.solve(LinearProgram(target, constraints))
+                program = method.program
+            values.append(target(program.solution))
+            violations[i] += method.stats.violations
+        assert values[0] == pytest.approx(values[1], abs=1e-9)
+    assert methods[1].stats.reordered > 0
+    assert violations[1] * 3 < violations[0]
+
+
+def test_move_to_front_reorders_remembered_constraints():
+    ordering = MoveToFront(size=2)
+    first, second, third = (Constraint(f"1 {k} 5") for k in (1, 2, 3))
+    program = LinearProgram(Target("1 1"), [], positive_x=False, positive_y=False)
+    program.status = ProgramStatus.INFEASIBLE
+    for constraint in (first, second, third):
+        ordering.record(program, [constraint])
+    assert len(ordering) == 2
+
+    constraints = [Constraint("1 1 1"), Constraint("1 3 5"), Constraint("1 2 5")]
+    # applied first is the most recent one
+    assert ordering.reorder(constraints, [0, 1, 2]) == ([1, 2, 0], 2)
+
+    arrays = seidel.ConstraintArray.from_constraints(constraints)
+    order, moved = ordering.reorder_indices(arrays, np.arange(3))
+    assert moved == 2
+    assert order.tolist() == [1, 2, 0]
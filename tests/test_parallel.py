@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+import seidel
+from seidel.batch import BatchSeidelMethod
+from seidel.parallel import ParallelSeidelMethod
+
+
+@pytest.fixture(scope="module")
+def method():
+    with ParallelSeidelMethod(processes=2, chunk_size=64, seed=0) as method:
+        yield method
+
+
+def random_programs(n, seed):
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(0, 30, n)
+    targets = rng.uniform(-1, 3, (n, 2))
+    coefficients = np.column_stack(
+        [rng.uniform(-1, 3, (counts.sum(), 2)), rng.uniform(-1, 10, counts.sum())]
+    )
+    return targets, coefficients, counts
+
+
+def test_parallel_agrees_with_batch(method):
+    targets, coefficients, counts = random_programs(500, 0)
+    result = method.solve_blocks(targets, coefficients, counts)
+
+    stacked = np.zeros((len(counts), counts.max(), 3))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    for i, (start, count) in enumerate(zip(starts, counts)):
+        stacked[i, :count] = coefficients[start : start + count]
+    expected = BatchSeidelMethod(0).solve_batch(targets, stacked, counts)
+    assert result.status.tolist() == expected.status.tolist()
+    np.testing.assert_allclose(result.objective, expected.objective, atol=1e-9)
+
+
+def test_parallel_results_dont_depend_on_processes(method):
+    targets, coefficients, counts = random_programs(300, 1)
+    result = method.solve_blocks(targets, coefficients, counts)
+    with ParallelSeidelMethod(processes=1, chunk_size=64, seed=0) as single:
+        expected = single.solve_blocks(targets, coefficients, counts)
+    np.testing.assert_array_equal(result.solution, expected.solution)
+
+
+def test_parallel_solves_binary_programs(method, tmp_path):
+    path = str(tmp_path / "programs.bin")
+    seidel.convert_programs(r"programs.txt", path)
+    result = method.solve_binary(seidel.BinaryPrograms(path))
+    for id, status in enumerate(result.statuses()):
+        expected = seidel.read_program(id, r"programs.txt")
+        seidel.Solver(seidel.SeidelMethod()).solve(expected)
+        assert status == expected.status
+        assert result.point(id) == expected.solution
+
+
+def test_parallel_solves_single_program(method):
+    program = seidel.read_program(1, r"programs.txt")
+    expected = seidel.read_program(1, r"programs.txt")
+    seidel.Solver(method).solve(program)
+    seidel.Solver(seidel.SeidelMethod()).solve(expected)
+    assert program.status == expected.status
+    assert program.solution == expected.solution
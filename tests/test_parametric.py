@@ -0,0 +1,70 @@
+import math
+import random
+
+import pytest
+
+import seidel
+from seidel.geometric_objects import Point
+from seidel.linear_program import Constraint, ProgramStatus, Target
+
+
+def fresh_solution(target, parametric):
+    program = parametric.program()
+    program.status, program.solution = ProgramStatus.NOT_SOLVED, None
+    seidel.Solver(seidel.SeidelMethod()).solve(program)
+    return program
+
+
+def test_parametric_ranges_and_shadow_prices():
+    constraints = [Constraint("1 1 4"), Constraint("1 -1 2"), Constraint("0 1 10")]
+    parametric = seidel.ParametricProgram(Target("2 1"), constraints, seed=0)
+    assert parametric.status == ProgramStatus.OPTIMAL
+    assert parametric.solution == Point(3, 1)
+    assert sorted(parametric.active()) == [0, 1]
+    # x + y <= C keeps the vertex of x - y = 2 in the first quadrant up to y = 10
+    assert parametric.rhs_range(0) == pytest.approx((2, 22))
+    assert parametric.rhs_range(2) == (1, math.inf)
+    assert parametric.shadow_price(0) == pytest.approx(1.5)
+    assert parametric.shadow_price(1) == pytest.approx(0.5)
+    assert parametric.shadow_price(2) == 0.0
+    assert parametric.ranges()[2].tolist() == [1, math.inf]
+
+
+def test_parametric_updates_inside_ranges_dont_solve():
+    constraints = [Constraint("1 1 4"), Constraint("1 -1 2"), Constraint("0 1 10")]
+    parametric = seidel.ParametricProgram(Target("2 1"), constraints, seed=0)
+    assert parametric.set_rhs(0, 6)
+    assert parametric.solution == Point(4, 2)
+    assert parametric.set_rhs(2, 3)
+    assert parametric.resolves == 1
+    # y <= 3 cuts the vertex of x + y = 9
+    assert not parametric.set_rhs(0, 9)
+    assert parametric.resolves == 2
+    assert parametric.solution == Point(5, 3)
+    assert not parametric.set_rhs(2, -1)
+    assert parametric.status == ProgramStatus.INFEASIBLE
+
+
+def test_parametric_program_matches_fresh_solves():
+    rng = random.Random(0)
+    target = Target("1 2")
+    constraints = [
+        Constraint(f"{rng.uniform(-1, 3)} {rng.uniform(-1, 3)} {rng.uniform(1, 10)}")
+        for _ in range(30)
+    ] + [Constraint("1 1 20")]
+    parametric = seidel.ParametricProgram(target, constraints, seed=1)
+    fast = 0
+    for _ in range(300):
+        if parametric.active() and rng.random() < 0.6:
+            k = rng.choice(parametric.active())
+        else:
+            k = rng.randrange(len(parametric))
+        value = parametric.coefficients[k, 2] + rng.uniform(-0.5, 0.5)
+        fast += parametric.set_rhs(k, max(value, 0.1))
+        expected = fresh_solution(target, parametric)
+        assert parametric.status == expected.status
+        if expected.status == ProgramStatus.OPTIMAL:
+            assert math.isclose(
+                target(parametric.solution), target(expected.solution), abs_tol=1e-9
+            )
+    assert fast > 150
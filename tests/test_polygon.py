@@ -0,0 +1,71 @@
+import math
+
+import numpy as np
+import pytest
+import seidel
+from seidel.geometric_objects import Point
+from seidel.linear_program import Constraint, ProgramStatus, Target
+from seidel.polygon import FeasiblePolygon
+
+
+@pytest.mark.parametrize("id", range(6))
+def test_polygon_agrees_with_seidel(id):
+    expected = seidel.read_program(id, r"programs.txt")
+    seidel.Solver(seidel.SeidelMethod()).solve(expected)
+    program = seidel.read_program(id, r"programs.txt")
+    FeasiblePolygon.from_program(program).solve(program)
+    assert program.status == expected.status
+    assert program.solution == expected.solution
+
+
+def test_polygon_vertices_counterclockwise():
+    polygon = FeasiblePolygon.from_constraints(
+        [Constraint("1 0 2"), Constraint("0 1 1"), Constraint("1 1 2.5")]
+    )
+    assert polygon.rays is None
+    assert polygon.vertices.tolist() == [
+        [0.0, 0.0],
+        [2.0, 0.0],
+        [2.0, 0.5],
+        [1.5, 1.0],
+        [0.0, 1.0],
+    ]
+
+
+def test_polygon_many_targets():
+    # tangents of the unit circle
+    angles = np.linspace(0, math.pi / 2, 1000)
+    polygon = FeasiblePolygon.from_constraints(
+        [Constraint(f"{math.cos(angle)!r} {math.sin(angle)!r} 1.0") for angle in angles]
+    )
+    directions = np.linspace(-math.pi, math.pi, 10001)
+    targets = np.column_stack([np.cos(directions), np.sin(directions)])
+    result = polygon.maximize_many(targets)
+    assert set(result.statuses()) == {ProgramStatus.OPTIMAL}
+    positive = (targets[:, 0] >= 0) & (targets[:, 1] >= 0)
+    # the optimum lies on the circle, up to the gaps between tangents
+    assert np.allclose(result.objective[positive], 1, atol=1e-5)
+    assert np.allclose(
+        result.objective[~positive], np.maximum(targets[~positive].max(axis=1), 0)
+    )
+
+
+def test_polygon_unbounded_region():
+    # y >= x - 1
+    polygon = FeasiblePolygon.from_constraints([Constraint("1 -1 1")])
+    assert polygon.maximize(Target("-1 1"))[0] == ProgramStatus.UNBOUNDED
+    assert polygon.maximize(Target("1 0"))[0] == ProgramStatus.UNBOUNDED
+    assert polygon.maximize(Target("1 -1")) == (ProgramStatus.OPTIMAL, Point(1, 0))
+    assert polygon.maximize(Target("-1 -1")) == (ProgramStatus.OPTIMAL, Point(0, 0))
+
+
+def test_polygon_degenerate_and_infeasible_regions():
+    segment = FeasiblePolygon.from_constraints(
+        [Constraint("1 1 1"), Constraint("-1 -1 -1")]
+    )
+    assert segment.maximize(Target("1 2")) == (ProgramStatus.OPTIMAL, Point(0, 1))
+    assert segment.maximize(Target("2 1")) == (ProgramStatus.OPTIMAL, Point(1, 0))
+
+    infeasible = FeasiblePolygon.from_constraints([Constraint("1 1 -1")])
+    result = infeasible.maximize_many(np.ones((3, 2)))
+    assert result.statuses() == [ProgramStatus.INFEASIBLE] * 3
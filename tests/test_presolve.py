@@ -0,0 +1,62 @@
+import seidel
+from seidel.linear_program import Constraint, ProgramStatus, Target
+from seidel.presolve import presolve_program
+
+
+def test_presolve_keeps_tightest_constraint_of_direction():
+    tight = Constraint("2 2 2")
+    program = seidel.LinearProgram(
+        Target("2 1"),
+        [Constraint("1 1 3"), tight, Constraint("1 1 2"), Constraint("0 0 1")],
+    )
+    result = presolve_program(program)
+    assert result.status == ProgramStatus.NOT_SOLVED
+    # loose and duplicated constraints and the trivial one
+    assert (result.removed, result.dominated, result.trivial) == (3, 2, 1)
+    assert tight in result.constraints
+    assert len(result.constraints) == 3
+    # the program keeps all of its constraints and the axes
+    assert len(program.constraints) == 6
+
+
+def test_presolve_counts_repeated_constraint_object():
+    repeated = Constraint("1 1 2")
+    program = seidel.LinearProgram(
+        Target("2 1"), [repeated, Constraint("1 1 3"), repeated]
+    )
+    result = presolve_program(program)
+    assert (result.removed, result.dominated) == (2, 2)
+    assert result.constraints == [repeated, *program.constraints[3:]]
+    assert len(program.constraints) - len(result.constraints) == result.removed
+
+
+def test_presolve_detects_opposite_constraints():
+    program = seidel.read_program(3, r"programs.txt")
+    solver = seidel.Solver(seidel.SeidelMethod(), presolve=True)
+    solver.solve(program)
+    assert solver.presolve_result.status == ProgramStatus.INFEASIBLE
+    assert program.status == ProgramStatus.INFEASIBLE
+
+
+def test_presolve_doesnt_change_solution():
+    for id in [0, 1, 2, 4, 5]:
+        expected = seidel.read_program(id, r"programs.txt")
+        seidel.Solver(seidel.SeidelMethod()).solve(expected)
+        program = seidel.read_program(id, r"programs.txt")
+        seidel.Solver(seidel.SeidelMethod(), presolve=True).solve(program)
+        assert program.status == expected.status
+        assert program.solution == expected.solution
+
+
+def test_presolve_doesnt_change_program_between_solves():
+    program = seidel.LinearProgram(
+        Target("2 1"), [Constraint("1 1 3"), Constraint("1 1 3"), Constraint("0 1 2")]
+    )
+    solver = seidel.Solver(seidel.SeidelMethod(seed=1), presolve=True)
+    solver.solve(program)
+    solution = program.solution
+    assert len(program.constraints) == 5
+    solver.solve(program)
+    assert len(program.constraints) == 5
+    assert program.status == ProgramStatus.OPTIMAL
+    assert program.solution == solution
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+import seidel
+from seidel.read_program import INDEX_SUFFIX, program_index
+
+PROGRAMS = """# komentarz
+!0
+2 1
+-4 3 -2
+1 2 3
+
+!10
+2 1
+-1 2 3
+"""
+
+
+def test_read_program_by_id(tmp_path):
+    path = tmp_path / "programs.txt"
+    path.write_text(PROGRAMS, encoding="utf-8")
+    program = seidel.read_program(10, str(path))
+    assert (program.target.x, program.target.y) == (2, 1)
+    # the constraint and both axes
+    assert len(program.constraints) == 3
+    with pytest.raises(KeyError):
+        seidel.read_program(1, str(path))
+
+
+def test_program_index_is_saved_and_invalidated(tmp_path):
+    path = tmp_path / "programs.txt"
+    path.write_text(PROGRAMS, encoding="utf-8")
+    offsets = program_index(str(path))
+    assert sorted(offsets) == [0, 10]
+    with open(str(path) + INDEX_SUFFIX) as f:
+        assert json.load(f)["offsets"] == {str(k): v for k, v in offsets.items()}
+
+    path.write_text(PROGRAMS + "\n!11\n1 1\n1 1 1\n", encoding="utf-8")
+    assert sorted(program_index(str(path))) == [0, 10, 11]
+    program = seidel.read_program(11, str(path))
+    assert len(program.constraints) == 3
+
+
+def test_iter_programs(tmp_path):
+    path = tmp_path / "programs.txt"
+    path.write_text(PROGRAMS, encoding="utf-8")
+    assert [id for id, _ in seidel.iter_programs(str(path))] == [0, 10]
+    programs = list(seidel.iter_programs(str(path), ids={10}))
+    assert len(programs) == 1
+    assert len(programs[0][1].constraints) == 3
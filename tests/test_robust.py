@@ -0,0 +1,54 @@
+from fractions import Fraction
+
+import pytest
+import seidel
+from seidel.linear_program import Constraint, LinearProgram, ProgramStatus, Target
+from seidel.robust import ExactPoint, cross_sign, side
+
+
+def test_side_falls_back_to_exact_arithmetic():
+    # the float sum 0.1 + 0.2 rounds up to the bound, the exact one is below it
+    constraint = Constraint("1.0 1.0 0.30000000000000004")
+    point = ExactPoint(Fraction(0.1), Fraction(0.2))
+    assert side(constraint, point) == -1
+    assert side(constraint, ExactPoint(Fraction(0.1), Fraction(0.3))) == 1
+
+
+def test_cross_sign_of_nearly_parallel_vectors():
+    assert cross_sign((1.0, 1.0), (1.0, 1.0 + 2**-52)) == 1
+    assert cross_sign((1.0, 1.0 + 2**-52), (1.0, 1.0)) == -1
+    assert cross_sign((3.0, 6.0), (0.5, 1.0)) == 0
+
+
+@pytest.mark.parametrize("id", range(6))
+def test_robust_agrees_with_default(id):
+    expected = seidel.read_program(id, r"programs.txt")
+    seidel.Solver(seidel.SeidelMethod()).solve(expected)
+    program = seidel.read_program(id, r"programs.txt")
+    seidel.Solver(seidel.SeidelMethod(robust=True)).solve(program)
+    assert program.status == expected.status
+    assert program.solution == expected.solution
+
+
+def test_robust_degenerate_vertex():
+    # every constraint passes through (1, 1)
+    constraints = [Constraint(f"{a} {4 - a} 4") for a in (0.5, 1.5, 2.5, 3.5)] * 5
+    program = LinearProgram(Target("1 1"), constraints)
+    seidel.Solver(seidel.SeidelMethod(robust=True)).solve(program)
+    assert program.status == ProgramStatus.OPTIMAL
+    assert (program.solution.x, program.solution.y) == (1.0, 1.0)
+
+
+def test_robust_nearly_parallel_constraints():
+    # lines cross at (1, 0) only, the optimum is where the tighter one meets x = 0
+    constraints = [Constraint("1 1 1"), Constraint(f"1 {1 + 2**-40} 1")]
+    program = LinearProgram(Target("0 1"), constraints)
+    seidel.Solver(seidel.SeidelMethod(robust=True)).solve(program)
+    assert program.status == ProgramStatus.OPTIMAL
+    assert program.solution.x == 0.0
+    assert program.solution.y == 1 / (1 + 2**-40)
+
+
+def test_robust_rejects_vectorized():
+    with pytest.raises(ValueError):
+        seidel.SeidelMethod(vectorized=True, robust=True)
@@ -1,6 +1,10 @@
+import math
+
+import numpy as np
 import pytest
 import seidel
 from seidel.geometric_objects import FLOAT_EQUALITY_DELTA, Point
+from seidel.linear_program import Constraint, Target
 from seidel.seidel import ProgramStatus, SeidelMethod
 
 
@@ -11,13 +15,16 @@ from seidel.seidel import ProgramStatus, SeidelMethod
         (1, ProgramStatus.OPTIMAL, Point(1.8, 0.6), 4.2),
         (2, ProgramStatus.UNBOUNDED, None, None),
         (3, ProgramStatus.INFEASIBLE, None, None),
-        # (4, ProgramStatus.UNBOUNDED, None, None),
+        (4, ProgramStatus.UNBOUNDED, None, None),
         (5, ProgramStatus.OPTIMAL, Point(0.66, 0.0), 3.33),
     ],
 )
-def test_seidel_solver_status(id, expected_status, expected_solution, expected_target):
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_seidel_solver_status(
+    id, expected_status, expected_solution, expected_target, vectorized
+):
     program = seidel.read_program(id, r"programs.txt")
-    solver = seidel.Solver(seidel.SeidelMethod())
+    solver = seidel.Solver(seidel.SeidelMethod(vectorized=vectorized))
     solver.solve(program)
     assert program.status == expected_status
     assert program.solution == expected_solution
@@ -25,3 +32,132 @@ def test_seidel_solver_status(id, expected_status, expected_solution, expected_t
         assert program.target(program.solution) is expected_target
     else:
         assert program.target(program.solution) - expected_target < FLOAT_EQUALITY_DELTA
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_seidel_solver_many_constraints(vectorized):
+    # tangents of the unit circle, the optimum lies between the two closest to 45 degrees
+    constraints = [
+        f"{math.cos(angle)} {math.sin(angle)} 1"
+        for angle in (math.pi / 2 * (i + 0.5) / 2000 for i in range(2000))
+    ]
+    program = seidel.LinearProgram.from_strings("1 1", constraints)
+    solver = seidel.Solver(seidel.SeidelMethod(vectorized=vectorized, chunk_size=64))
+    solver.solve(program)
+    assert program.status == ProgramStatus.OPTIMAL
+    assert abs(program.target(program.solution) - math.sqrt(2)) < 1e-6
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_seidel_solver_stats(vectorized):
+    violations = []
+    method = seidel.SeidelMethod(
+        vectorized=vectorized,
+        collect_stats=True,
+        on_violation=lambda constraint, program, applied: violations.append(applied),
+    )
+    program = seidel.read_program(1, r"programs.txt")
+    seidel.Solver(method).solve(program)
+    stats = method.stats
+    assert stats.violations == len(stats.applied_sizes) == len(violations)
+    assert stats.applied_sizes == violations
+    # constraints other than the basic one, vectorized method checks the axes too
+    assert stats.contains_calls == (4 if vectorized else 2)
+    assert stats.basic_seconds >= 0 and stats.loop_seconds >= 0
+
+
+def test_seidel_solver_without_stats():
+    method = seidel.SeidelMethod()
+    seidel.Solver(method).solve(seidel.read_program(1, r"programs.txt"))
+    assert method.stats is None
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_seidel_solver_doesnt_change_program(vectorized):
+    constraints = [Constraint(f"1 {k} {k + 2}") for k in range(50)]
+    program = seidel.LinearProgram(Target("1 2"), constraints)
+    assert len(constraints) == 50
+    stored = list(program.constraints)
+
+    first = SeidelMethod(vectorized=vectorized, seed=0, collect_stats=True)
+    first.solve(program)
+    solution, violations = program.solution, first.stats.violations
+    assert program.constraints == stored
+
+    # solving again with the same seed repeats the solve
+    again = SeidelMethod(vectorized=vectorized, seed=0, collect_stats=True)
+    again.solve(program)
+    assert program.status == ProgramStatus.OPTIMAL
+    assert program.solution == solution
+    assert again.stats.violations == violations
+
+
+@pytest.mark.parametrize(
+    "target,constraints,expected_status,expected_target",
+    [
+        # nothing encloses the program, but it is infeasible
+        ("1 1", ["0 1 -3"], ProgramStatus.INFEASIBLE, None),
+        # the target doesnt grow in the I quart
+        ("-2 0", ["2 0 1"], ProgramStatus.OPTIMAL, 0.0),
+        ("-2 2", ["0 3 2"], ProgramStatus.OPTIMAL, 4 / 3),
+        # the target doesnt grow along x - y = 1
+        ("1 -1", ["1 -1 1"], ProgramStatus.OPTIMAL, 1.0),
+        ("-1 0", ["-1 0 -1e12"], ProgramStatus.OPTIMAL, -1e12),
+        ("1 1", ["1 -1 1"], ProgramStatus.UNBOUNDED, None),
+    ],
+)
+@pytest.mark.parametrize(
+    "settings", [{}, {"vectorized": True}, {"robust": True}], ids=str
+)
+def test_seidel_solver_unenclosed_programs(
+    target, constraints, expected_status, expected_target, settings
+):
+    program = seidel.LinearProgram.from_strings(target, constraints)
+    SeidelMethod(seed=0, **settings).solve(program)
+    assert program.status == expected_status
+    if expected_target is None:
+        assert program.solution is None
+    else:
+        assert program.target(program.solution) == pytest.approx(expected_target)
+
+
+DEGENERATE = [
+    (1, -2, 1),
+    (2, -2, -2),
+    (-1, 1, -1),
+    (1, -1, 1),
+    (-3, -2, 2),
+    (2, -4, 2),
+    (4, -4, -4),
+    (-2, 2, -2),
+    (2, -2, 2),
+    (-6, -4, 4),
+]
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_seidel_solver_degenerate_program_over_seeds(vectorized):
+    rng = np.random.default_rng(0)
+    for seed in range(10):
+        rows = [DEGENERATE[i] for i in rng.permutation(len(DEGENERATE))]
+        program = seidel.LinearProgram(
+            Target("-1 1"), [Constraint.from_coefficients(*row) for row in rows]
+        )
+        SeidelMethod(vectorized=vectorized, seed=seed).solve(program)
+        assert program.status == ProgramStatus.INFEASIBLE
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_seidel_solver_basis_doesnt_depend_on_order(vectorized):
+    # parallel xminus candidates with the same ratio, the tightest is chosen
+    rows = [(1, -1, 3), (2, -2, 2), (1, -1, 5), (-1, 2, 1)]
+    rng = np.random.default_rng(0)
+    for seed in range(10):
+        shuffled = [rows[i] for i in rng.permutation(len(rows))]
+        program = seidel.LinearProgram(
+            Target("1 1"), [Constraint.from_coefficients(*row) for row in shuffled]
+        )
+        method = SeidelMethod(vectorized=vectorized, seed=seed)
+        method.solve(program)
+        assert [(c.x, c.y, c.b) for c in method.applied[2:4]] == [rows[1], rows[3]]
+        assert program.solution == Point(3, 2)
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from seidel.server import SolveServer, parse_request
+
+
+async def exchange(server, messages):
+    host, port = server.address
+    reader, writer = await asyncio.open_connection(host, port)
+    for message in messages:
+        writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in messages]
+    writer.close()
+    await writer.wait_closed()
+    return {response["id"]: response for response in responses}
+
+
+def test_server_solves_programs():
+    async def run():
+        async with SolveServer(seed=0) as server:
+            return await exchange(
+                server,
+                [
+                    {"id": 0, "target": [2, 1], "constraints": [[1, 1, 3]]},
+                    {"id": 1, "target": [1, 1], "constraints": [[1, -1, 1]]},
+                    {"id": 2, "target": [1, 1], "constraints": [[1, 1, -1]]},
+                    {"id": 3, "target": [1, 1]},
+                ],
+            )
+
+    responses = asyncio.run(run())
+    assert responses[0]["status"] == "OPTIMAL"
+    assert responses[0]["solution"] == [3.0, 0.0]
+    assert responses[0]["objective"] == 6.0
+    assert responses[0]["latency"] > 0
+    assert responses[1]["status"] == "UNBOUNDED"
+    assert responses[2]["status"] == "INFEASIBLE"
+    assert "constraints" in responses[3]["error"]
+
+
+def test_server_batches_concurrent_requests():
+    async def run():
+        async with SolveServer(max_batch=64, max_delay=0.05) as server:
+            clients = [
+                exchange(
+                    server,
+                    [
+                        {
+                            "id": i,
+                            "target": [1, 1],
+                            "constraints": [[1, 0, i], [0, 1, 1]],
+                        }
+                        for i in range(start, start + 20)
+                    ],
+                )
+                for start in (0, 20, 40)
+            ]
+            results = await asyncio.gather(*clients)
+            stats = await exchange(server, [{"id": "stats", "stats": True}])
+            return results, stats["stats"]
+
+    results, stats = asyncio.run(run())
+    for responses in results:
+        for i, response in responses.items():
+            assert response["objective"] == i + 1
+    assert stats["solved"] == 60
+    assert stats["batches"] < 60
+    assert stats["queue_depth"] == 0
+    assert stats["throughput"] > 0
+
+
+def test_server_close_answers_requests_in_flight():
+    release = threading.Event()
+
+    class BlockingExecutor(ThreadPoolExecutor):
+        """Solves batches only after the server started closing."""
+
+        def submit(self, function, *args):
+            def blocked():
+                release.wait(5)
+                return function(*args)
+
+            return super().submit(blocked)
+
+    async def run():
+        executor = BlockingExecutor(1)
+        server = SolveServer(max_batch=1, max_delay=0, workers=1, executor=executor)
+        await server.start()
+        # the first one is solved, the second one waits for a worker,
+        # the others are queued
+        requests = [
+            asyncio.create_task(server.solve([1, 1], [[1, 1, 4]])) for _ in range(4)
+        ]
+        await asyncio.sleep(0.05)
+        closing = asyncio.create_task(server.close())
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.wait_for(closing, 2)
+        results = await asyncio.wait_for(
+            asyncio.gather(*requests, return_exceptions=True), 2
+        )
+        executor.shutdown()
+        with pytest.raises(ValueError):
+            await server.solve([1, 1], [[1, 1, 4]])
+        return results
+
+    results = asyncio.run(run())
+    assert results[0]["status"] == "OPTIMAL"
+    assert all(isinstance(result, ValueError) for result in results[1:])
+
+
+def test_server_close_fails_batch_being_gathered():
+    async def run():
+        server = SolveServer(max_delay=10)
+        await server.start()
+        request = asyncio.create_task(server.solve([1, 1], [[1, 1, 4]]))
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(server.close(), 2)
+        with pytest.raises(ValueError, match="closed"):
+            await asyncio.wait_for(request, 2)
+
+    asyncio.run(run())
+
+
+def test_parse_request_checks_constraints():
+    _, constraints = parse_request([1, 1], [])
+    assert constraints.shape == (0, 3)
+    _, constraints = parse_request([1, 1], [[1, 1, 4], [0, 1, 2]])
+    assert constraints.shape == (2, 3)
+    for malformed in ([[1, 1], [0, 1]], [1, 1, 4], [[[1, 1, 4]]]):
+        with pytest.raises(ValueError, match="three coefficients"):
+            parse_request([1, 1], malformed)
+    with pytest.raises(ValueError, match="malformed"):
+        parse_request([1, 1], [[1, 1, 4], [1, 1]])
+
+
+def test_server_answers_large_and_too_long_requests():
+    constraints = [[1, 1, 4]] + [[1, 1, 5 + i] for i in range(5000)]
+    large = {"id": 0, "target": [1, 1], "constraints": constraints}
+
+    async def run():
+        async with SolveServer(seed=0) as server:
+            solved = await exchange(server, [large])
+        async with SolveServer(seed=0, limit=1024) as server:
+            refused = await exchange(server, [large])
+        return solved, refused
+
+    solved, refused = asyncio.run(run())
+    assert solved[0]["status"] == "OPTIMAL"
+    assert solved[0]["objective"] == 4.0
+    assert refused[None]["error"] == "request is longer than the limit"
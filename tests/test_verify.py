@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+import seidel
+from seidel.geometric_objects import Point
+from seidel.verify import verify
+
+
+@pytest.mark.parametrize("id", [0, 1, 5])
+def test_verify_accepts_solutions(id):
+    program = seidel.read_program(id, r"programs.txt")
+    seidel.Solver(seidel.SeidelMethod()).solve(program)
+    result = verify(program)
+    assert result.feasible.tolist() == [True]
+    assert result.max_violation.tolist() == [0.0]
+    # the optimum is a vertex
+    assert len(result.tight[0]) >= 2
+
+
+def test_verify_reports_violated_and_tight_constraints():
+    # x + y <= 4, x <= 3, -x + y <= 1
+    coefficients = np.array([[1.0, 1, 4], [1, 0, 3], [-1, 1, 1]])
+    points = np.array([[3, 1], [0, 2], [1, 1]])
+    result = verify(coefficients, points)
+    assert result.feasible.tolist() == [True, False, True]
+    assert result.max_violation == pytest.approx([0, 1, 0])
+    assert [v.tolist() for v in result.violated] == [[], [2], []]
+    assert [t.tolist() for t in result.tight] == [[0, 1], [], []]
+
+    arrays = seidel.ConstraintArray.from_coefficients(coefficients)
+    single = verify(arrays, Point(0, 2))
+    assert single.violated[0].tolist() == [2]
+
+
+def test_verify_in_chunks_with_limit(tmp_path):
+    rng = np.random.default_rng(0)
+    coefficients = np.column_stack(
+        [rng.uniform(-1, 1, (5000, 2)), rng.uniform(1, 2, 5000)]
+    )
+    path = tmp_path / "coefficients.npy"
+    np.save(path, coefficients)
+    mapped = np.load(path, mmap_mode="r")
+    points = np.array([[0.1, 0.1], [3, 3], [2, 0]])
+
+    expected = verify(coefficients, points)
+    result = verify(mapped, points, chunk_size=300, limit=10)
+    assert result.violations.tolist() == expected.violations.tolist()
+    np.testing.assert_allclose(result.max_violation, expected.max_violation)
+    for limited, violated in zip(result.violated, expected.violated):
+        assert limited.tolist() == violated[:10].tolist()
+    # computed from all constraints, not only the reported ones
+    assert result.violations[1] > 10
+
+
+def test_verify_needs_a_point():
+    program = seidel.read_program(2, r"programs.txt")
+    seidel.Solver(seidel.SeidelMethod()).solve(program)
+    with pytest.raises(ValueError):
+        verify(program)